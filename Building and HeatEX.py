@@ -11,11 +11,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, Optional
 
+import numpy as np
+
 ###############################################################################
 # Pump
 ###############################################################################
 
-@dataclass
+@dataclass(slots=True)
 class Pump:
     """Simple pump/fan that converts electrical power to volumetric flow.
 
@@ -59,7 +61,7 @@ class Pump:
 # Air-cooled component
 ###############################################################################
 
-@dataclass
+@dataclass(slots=True)
 class AirCooledComponent:
     """Applies a known heat load to an airstream with an outlet temperature cap.
 
@@ -124,11 +126,49 @@ class AirCooledComponent:
             "m_dot_required_min_kg_s": m_dot_required_min
         }
 
+    def process_array(self, T_in_C, m_dot_air_kg_s) -> Dict[str, np.ndarray]:
+        """Array version of process: same keys, one element per scenario.
+
+        T_in_C and m_dot_air_kg_s may be scalars or arrays and are broadcast
+        against each other, so a sweep over N inlet conditions is a handful of
+        NumPy expressions instead of N calls.
+        """
+        T_in_C, m_dot = np.broadcast_arrays(
+            np.asarray(T_in_C, dtype=float), np.asarray(m_dot_air_kg_s, dtype=float)
+        )
+        if np.any(m_dot <= 0):
+            raise ValueError("Air mass flow must be > 0.")
+        T_out_ideal = T_in_C + self.Q_W / (m_dot * self.cp_air)
+        allowable_deltaT = np.maximum(0.0, self.max_outlet_C - T_in_C)
+        Q_absorbable = m_dot * self.cp_air * allowable_deltaT
+        cap_active = T_out_ideal > self.max_outlet_C
+        with np.errstate(divide="ignore"):
+            m_dot_required_min = np.where(
+                allowable_deltaT > 0,
+                self.Q_W / (self.cp_air * np.maximum(1e-9, allowable_deltaT)),
+                np.inf,
+            )
+
+        return {
+            "component": self.name,
+            "T_in_C": T_in_C,
+            "T_out_C": np.where(cap_active, self.max_outlet_C, T_out_ideal),
+            "T_out_ideal_C": T_out_ideal,
+            "max_outlet_C": self.max_outlet_C,
+            "m_dot_air_kg_s": m_dot,
+            "cp_air_J_per_kgK": self.cp_air,
+            "Q_load_W": self.Q_W,
+            "Q_absorbed_W": np.where(cap_active, Q_absorbable, self.Q_W),
+            "Q_unmet_W": np.where(cap_active, np.maximum(0.0, self.Q_W - Q_absorbable), 0.0),
+            "cap_active": cap_active,
+            "m_dot_required_min_kg_s": m_dot_required_min
+        }
+
 ###############################################################################
 # Building heat exchanger (generic two-stream, single efficiency)
 ###############################################################################
 
-@dataclass
+@dataclass(slots=True)
 class BuildingHeatExchanger:
     """Two-stream heat exchanger using a single efficiency (effectiveness).
 
@@ -199,6 +239,47 @@ class BuildingHeatExchanger:
             "Q_transferred_W": Q
         }
 
+    def exchange_array(self,
+                       m_dot_1_kg_s, cp_1_J_per_kgK, T1_in_C,
+                       m_dot_2_kg_s, cp_2_J_per_kgK, T2_in_C,
+                       efficiency) -> Dict[str, np.ndarray]:
+        """Array version of exchange: inputs broadcast, same keys as exchange().
+
+        The hot/cold selection is done per element with np.where, so N
+        scenarios cost O(1) Python calls.
+        """
+        m1, cp1, T1, m2, cp2, T2, eff = np.broadcast_arrays(*(
+            np.asarray(v, dtype=float) for v in
+            (m_dot_1_kg_s, cp_1_J_per_kgK, T1_in_C, m_dot_2_kg_s, cp_2_J_per_kgK, T2_in_C, efficiency)
+        ))
+        if np.any(m1 <= 0) or np.any(m2 <= 0):
+            raise ValueError("Mass flows must be > 0.")
+        if np.any(cp1 <= 0) or np.any(cp2 <= 0):
+            raise ValueError("Heat capacities must be > 0.")
+        eff = np.clip(eff, 0.0, 1.0)
+
+        C1 = m1 * cp1
+        C2 = m2 * cp2
+        # Q >= 0 flows from the hotter inlet to the colder one
+        Q = eff * np.minimum(C1, C2) * np.abs(T1 - T2)
+        hot_is_1 = T1 >= T2
+        T1_out = np.where(hot_is_1, T1 - Q / C1, T1 + Q / C1)
+        T2_out = np.where(hot_is_1, T2 + Q / C2, T2 - Q / C2)
+
+        return {
+            "component": self.name,
+            "m_dot_1_kg_s": m1,
+            "cp_1_J_per_kgK": cp1,
+            "T1_in_C": T1,
+            "T1_out_C": T1_out,
+            "m_dot_2_kg_s": m2,
+            "cp_2_J_per_kgK": cp2,
+            "T2_in_C": T2,
+            "T2_out_C": T2_out,
+            "efficiency": eff,
+            "Q_transferred_W": Q
+        }
+
 ###############################################################################
 # Minimal demonstration (can be removed)
 ###############################################################################
@@ -20,7 +20,7 @@ def cp_mass_water(T_C: float) -> float:
     return Cp_molar / M_kg_per_mol
 
 # =================== Data classes (minimal-change) ===================
-@dataclass
+@dataclass(slots=True)
 class LiquidCoolingChip:
     N: int
     P_gpu: float
@@ -45,7 +45,7 @@ class LiquidCoolingChip:
             "dT_c": dT_c
         }
 
-@dataclass
+@dataclass(slots=True)
 class GpuBranches:
     N: int
     m_c_total: float
@@ -109,7 +109,7 @@ class GpuBranches:
             "dp1": dp1, "dp2": dp2, "dp3": dp3, "dp_path": dp_path
         }
 
-@dataclass
+@dataclass(slots=True)
 class Pump:
     m_c_total: float
     rho: float
@@ -121,7 +121,7 @@ class Pump:
         W_pump = (self.m_c_total / self.rho) * (self.dp_path / self.eta_p)
         return {"W_pump": W_pump}
 
-@dataclass
+@dataclass(slots=True)
 class HXer:
     # inputs
     Q_chip: float
@@ -13,8 +13,119 @@ Author: HVAC Team
 Date: 2025-11-19
 """
 
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from typing import Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+import logging
 import math
+import os
+import warnings
+
+import numpy as np
+
+from psychrometrics import MoistAir, PsychrometricState
+
+logger = logging.getLogger(__name__)
+
+# Water-side constants shared by the chiller, tower and system models
+_CP_WATER_J_PER_KG_K = 4186.0   # specific heat of water 水的比热容
+_Q_COND_OVERESTIMATE = 1.15     # Q_cond / Q_evap used to size the condenser-water flow
+_DELTA_T_CW_DESIGN_C = 5.5      # design condenser-water range 冷却水设计温差
+
+
+# ============================================================================
+# PARAMETER VALIDATION
+# ============================================================================
+
+# Design-parameter range checks, shared by the component constructors and
+# CoolingSystem.update_conditions 设计参数范围检查
+
+def _check_rated_capacity(rated_capacity_mw):
+    if rated_capacity_mw <= 0:
+        raise ValueError(f"Invalid rated_capacity_mw: {rated_capacity_mw}, must be > 0")
+
+
+def _check_rated_cop(rated_cop):
+    if rated_cop <= 0 or rated_cop > 10:
+        raise ValueError(f"Invalid rated_cop: {rated_cop}, must be between 0 and 10")
+
+
+def _check_t_chw_supply(t_chw_supply):
+    if t_chw_supply < 0 or t_chw_supply >= 30:
+        raise ValueError(f"Invalid t_chw_supply: {t_chw_supply}, must be between 0 and 30 °C")
+
+
+def _check_approach(approach_temp):
+    if approach_temp <= 0 or approach_temp > 20:
+        raise ValueError(f"Invalid approach_temp: {approach_temp}, must be between 0 and 20 °C")
+
+
+def _check_coc(coc):
+    if coc < 2 or coc > 10:
+        raise ValueError(f"Invalid coc: {coc}, must be between 2 and 10")
+
+
+def _check_static_head(static_head):
+    if static_head < 0 or static_head > 100:
+        raise ValueError(f"Invalid static_head: {static_head}, must be between 0 and 100 m")
+
+
+def _check_pump_efficiency(efficiency):
+    if efficiency <= 0 or efficiency > 1.0:
+        raise ValueError(f"Invalid efficiency: {efficiency}, must be between 0 and 1.0")
+
+# ============================================================================
+# RESULT CONTAINERS
+# ============================================================================
+
+class _DictCompatResult:
+    """
+    Read-only mapping access for slotted result dataclasses, so code written
+    against the former dict results (result["COP"], .get, .keys, .items,
+    .values) keeps working. Compatibility is partial: results are not dict
+    instances, so isinstance(result, dict) is False and json.dumps rejects
+    them - call to_dict() where a real dict is needed.
+    结果对象的字典式只读访问（部分兼容原先的字典返回值；需要真正的字典时请用 to_dict()）
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if key in type(self).__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in type(self).__slots__
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def keys(self):
+        return type(self).__slots__
+
+    def values(self):
+        return [getattr(self, name) for name in type(self).__slots__]
+
+    def items(self):
+        return [(name, getattr(self, name)) for name in type(self).__slots__]
+
+    def to_dict(self) -> Dict:
+        """Plain dict with the same keys as the former dict result. 转换为字典"""
+        return {name: getattr(self, name) for name in type(self).__slots__}
+
+
+def _broadcast_lanes(*values, dtype=np.float64):
+    """
+    Broadcast scalars/arrays to a common shape and flatten them into writable
+    1-D arrays (float64 unless dtype says otherwise), one element ("lane") per
+    operating point.
+    将标量/数组广播为等长的一维数组（每个元素对应一个工况）
+    """
+    arrays = np.broadcast_arrays(*(np.asarray(v, dtype=dtype) for v in values))
+    return [np.array(a, dtype=dtype).ravel() for a in arrays]
+
 
 # ============================================================================
 # REFRIGERANT CYCLE - Vapor Compression
@@ -25,7 +136,16 @@ try:
     COOLPROP_AVAILABLE = True
 except ImportError:
     COOLPROP_AVAILABLE = False
-    print("Warning: CoolProp not available. Install with: pip install CoolProp")
+    logger.warning("CoolProp not available. Install with: pip install CoolProp")
+
+
+@lru_cache(maxsize=None)
+def _critical_temperature(refrigerant):
+    """
+    Critical temperature lookup, shared by every state of the same refrigerant.
+    制冷剂临界温度（按制冷剂缓存，用于校验制冷剂名称）
+    """
+    return PropsSI("Tcrit", refrigerant)
 
 
 class RefrigerantState:
@@ -35,31 +155,26 @@ class RefrigerantState:
     """
 
     def __init__(self, refrigerant, **kwargs):
-        if not COOLPROP_AVAILABLE:
-            raise ImportError("CoolProp is required for refrigerant property calculations")
-
         self.refrigerant = refrigerant
         self._validate_refrigerant()
 
-        # Parse input properties
-        props = {}
-        for key, value in kwargs.items():
-            props[key] = value
-
+        # kwargs is a fresh dict owned by this call, so it is normalized in place
         # Convert temperature from °C to K if provided
-        if "T" in props:
-            props["T_K"] = props["T"] + 273.15
-            del props["T"]
+        if "T" in kwargs:
+            kwargs["T_K"] = kwargs.pop("T") + 273.15
 
-        if len(props) != 2:
-            raise ValueError(f"Exactly 2 properties required, got {len(props)}: {list(props.keys())}")
+        if len(kwargs) != 2:
+            raise ValueError(f"Exactly 2 properties required, got {len(kwargs)}: {list(kwargs.keys())}")
 
-        self._calculate_state(props)
+        self._calculate_state(kwargs)
 
     def _validate_refrigerant(self):
         try:
-            PropsSI("Tcrit", self.refrigerant)
+            _critical_temperature(self.refrigerant)
         except Exception as e:
+            # Availability is only checked once the lookup has failed, keeping it off the hot path
+            if not COOLPROP_AVAILABLE:
+                raise ImportError("CoolProp is required for refrigerant property calculations")
             raise ValueError(f"Invalid refrigerant '{self.refrigerant}': {e}")
 
     def _calculate_state(self, props):
@@ -92,6 +207,53 @@ class RefrigerantState:
             return "Superheated Vapor"
 
 
+# State points depend only on the saturation temperatures and the cycle
+# parameters, never on the instance, so the caches are module-level and shared
+# by every cycle (and every CoolingSystem) using the same refrigerant; flows and
+# heats scale with Q_evap. Each side of the cycle depends on one saturation
+# temperature only, and the evaporator temperature rarely moves between
+# operating points, so its states are reused across every condenser temperature.
+# 状态点只取决于饱和温度和循环参数，按制冷剂在所有实例间共享缓存
+
+@lru_cache(maxsize=64)
+def _evaporator_states(T_evap_C, refrigerant, superheat_evap):
+    P_evap = PropsSI("P", "T", T_evap_C + 273.15, "Q", 1.0, refrigerant)
+
+    # State 1: Evaporator outlet (superheated vapor)
+    T1_C = T_evap_C + superheat_evap
+    state1 = RefrigerantState(refrigerant, P=P_evap, T=T1_C)
+    return P_evap, state1
+
+
+@lru_cache(maxsize=256)
+def _condenser_states(T_cond_C, refrigerant, subcool_cond):
+    P_cond = PropsSI("P", "T", T_cond_C + 273.15, "Q", 0.0, refrigerant)
+
+    # State 3: Condenser outlet (subcooled liquid)
+    T3_C = T_cond_C - subcool_cond
+    state3 = RefrigerantState(refrigerant, P=P_cond, T=T3_C)
+    return P_cond, state3
+
+
+@lru_cache(maxsize=1024)
+def _cycle_states(T_evap_C, T_cond_C, refrigerant, eta_is_comp, superheat_evap, subcool_cond):
+    # Saturation pressures and the states pinned to them
+    P_evap, state1 = _evaporator_states(T_evap_C, refrigerant, superheat_evap)
+    P_cond, state3 = _condenser_states(T_cond_C, refrigerant, subcool_cond)
+
+    # State 2s: Isentropic compression
+    state2s = RefrigerantState(refrigerant, P=P_cond, s=state1.s)
+
+    # State 2: Actual compression
+    h2_actual = state1.h + (state2s.h - state1.h) / eta_is_comp
+    state2 = RefrigerantState(refrigerant, P=P_cond, h=h2_actual)
+
+    # State 4: After expansion valve
+    state4 = RefrigerantState(refrigerant, P=P_evap, h=state3.h)
+
+    return P_evap, P_cond, state1, state2s, state2, state3, state4
+
+
 class VaporCompressionCycle:
     """
     Complete vapor compression refrigeration cycle.
@@ -125,27 +287,11 @@ class VaporCompressionCycle:
         if Q_evap_required <= 0:
             raise ValueError(f"Cooling capacity must be positive, got {Q_evap_required}")
 
-        # Calculate saturation pressures
-        P_evap = PropsSI("P", "T", T_evap_C + 273.15, "Q", 1.0, self.refrigerant)
-        P_cond = PropsSI("P", "T", T_cond_C + 273.15, "Q", 0.0, self.refrigerant)
-
-        # State 1: Evaporator outlet (superheated vapor)
-        T1_C = T_evap_C + self.superheat_evap
-        self.state1 = RefrigerantState(self.refrigerant, P=P_evap, T=T1_C)
-
-        # State 2s: Isentropic compression
-        self.state2s = RefrigerantState(self.refrigerant, P=P_cond, s=self.state1.s)
-
-        # State 2: Actual compression
-        h2_actual = self.state1.h + (self.state2s.h - self.state1.h) / self.eta_is_comp
-        self.state2 = RefrigerantState(self.refrigerant, P=P_cond, h=h2_actual)
-
-        # State 3: Condenser outlet (subcooled liquid)
-        T3_C = T_cond_C - self.subcool_cond
-        self.state3 = RefrigerantState(self.refrigerant, P=P_cond, T=T3_C)
-
-        # State 4: After expansion valve
-        self.state4 = RefrigerantState(self.refrigerant, P=P_evap, h=self.state3.h)
+        (P_evap, P_cond, self.state1, self.state2s,
+         self.state2, self.state3, self.state4) = _cycle_states(
+            T_evap_C, T_cond_C, self.refrigerant,
+            self.eta_is_comp, self.superheat_evap, self.subcool_cond,
+        )
 
         # Calculate refrigerant mass flow rate
         q_evap_per_kg = self.state1.h - self.state4.h
@@ -250,6 +396,43 @@ class HeatExchanger:
 # PUMP SYSTEM - Fluid Circulation
 # ============================================================================
 
+@dataclass(slots=True, frozen=True)
+class PumpResult(_DictCompatResult):
+    """
+    Pump operating point returned by Pump.solve.
+    水泵求解结果
+    """
+    component: str
+    m_dot_kg_s: float
+    Q_m3_s: float
+    Q_L_s: float
+    density_kg_m3: float
+    H_static_m: float
+    H_equipment_m: float
+    H_total_m: float
+    efficiency: float
+    P_pump_W: float
+    P_pump_kW: float
+    P_pump_MW: float
+    E_fluid_W: float
+    energy_efficiency: float
+
+
+@dataclass(slots=True, frozen=True)
+class PumpSystemResult(_DictCompatResult):
+    """
+    Condenser water pump system result returned by PumpSystem.solve.
+    冷凝水泵系统求解结果
+    """
+    component: str
+    CW_pump: PumpResult
+    P_pump_W: float
+    P_pump_kW: float
+    P_pump_MW: float
+    static_head_m: float
+    efficiency: float
+
+
 class Pump:
     """
     Centrifugal pump using fluid dynamics principles.
@@ -260,12 +443,10 @@ class Pump:
 
     def __init__(self, pump_type, static_head=10.0, dynamic_head_factor=0.5,
                  equipment_head=5.0, efficiency=0.85):
-        if static_head < 0 or static_head > 100:
-            raise ValueError(f"Invalid static_head: {static_head}, must be between 0 and 100 m")
+        _check_static_head(static_head)
         if equipment_head < 0 or equipment_head > 50:
             raise ValueError(f"Invalid equipment_head: {equipment_head}, must be between 0 and 50 m")
-        if efficiency <= 0 or efficiency > 1.0:
-            raise ValueError(f"Invalid efficiency: {efficiency}, must be between 0 and 1.0")
+        _check_pump_efficiency(efficiency)
 
         self.pump_type = pump_type
         self.static_head = static_head
@@ -313,22 +494,22 @@ class Pump:
         P_pump = self.calculate_power(m_dot, density=density, H_total=H_total)
         E_fluid = m_dot * self.g * H_total
 
-        return {
-            "component": f"Pump ({self.pump_type})",
-            "m_dot_kg_s": m_dot,
-            "Q_m3_s": Q,
-            "Q_L_s": Q * 1000,
-            "density_kg_m3": density,
-            "H_static_m": self.static_head,
-            "H_equipment_m": self.equipment_head,
-            "H_total_m": H_total,
-            "efficiency": self.efficiency,
-            "P_pump_W": P_pump,
-            "P_pump_kW": P_pump / 1000,
-            "P_pump_MW": P_pump / 1e6,
-            "E_fluid_W": E_fluid,
-            "energy_efficiency": E_fluid / P_pump if P_pump > 0 else 0,
-        }
+        return PumpResult(
+            component=f"Pump ({self.pump_type})",
+            m_dot_kg_s=m_dot,
+            Q_m3_s=Q,
+            Q_L_s=Q * 1000,
+            density_kg_m3=density,
+            H_static_m=self.static_head,
+            H_equipment_m=self.equipment_head,
+            H_total_m=H_total,
+            efficiency=self.efficiency,
+            P_pump_W=P_pump,
+            P_pump_kW=P_pump / 1000,
+            P_pump_MW=P_pump / 1e6,
+            E_fluid_W=E_fluid,
+            energy_efficiency=E_fluid / P_pump if P_pump > 0 else 0,
+        )
 
 
 class PumpSystem:
@@ -348,44 +529,131 @@ class PumpSystem:
     def solve(self, m_dot_cw):
         cw_result = self.cw_pump.solve(m_dot_cw)
 
-        return {
-            "component": "Pump System (CW Loop)",
-            "CW_pump": cw_result,
-            "P_pump_W": cw_result["P_pump_W"],
-            "P_pump_kW": cw_result["P_pump_kW"],
-            "P_pump_MW": cw_result["P_pump_MW"],
-            "static_head_m": self.cw_pump.static_head,
-            "efficiency": self.cw_pump.efficiency,
-        }
+        return PumpSystemResult(
+            component="Pump System (CW Loop)",
+            CW_pump=cw_result,
+            P_pump_W=cw_result.P_pump_W,
+            P_pump_kW=cw_result.P_pump_kW,
+            P_pump_MW=cw_result.P_pump_MW,
+            static_head_m=self.cw_pump.static_head,
+            efficiency=self.cw_pump.efficiency,
+        )
 
 
 # ============================================================================
 # CHILLER - Water-Cooled Chiller
 # ============================================================================
 
+@dataclass(slots=True, frozen=True)
+class ChillerResult(_DictCompatResult):
+    """
+    Converged chiller operating point returned by Chiller.solve_energy_balance.
+    冷水机组求解结果
+    """
+    component: str
+    refrigerant: str
+    converged: bool
+    iterations: int
+    Q_evap_MW: float
+    Q_cond_MW: float
+    W_comp_MW: float
+    Q_cond_W: float
+    W_comp_W: float
+    COP: float
+    PLR: float
+    T_chw_supply_C: float
+    T_chw_return_C: float
+    delta_T_chw_C: float
+    m_dot_chw_kg_s: float
+    T_cw_in_C: float
+    T_cw_out_C: float
+    delta_T_cw_C: float
+    m_dot_cw_kg_s: float
+    T_evap_sat_C: float
+    T_cond_sat_C: float
+    m_dot_ref_kg_s: float
+    P_evap_kPa: float
+    P_cond_kPa: float
+    compression_ratio: float
+    energy_balance_error_pct: float
+    evap_effectiveness: float
+    cond_effectiveness: float
+
+
+def _chiller_pinch_loop(solve_cycle, q_evap, t_chw_supply, t_cw_in, mcp_cw, max_iter, tolerance):
+    """
+    Fixed-point iteration on the evaporator/condenser saturation temperatures.
+    蒸发/冷凝饱和温度的不动点迭代
+
+    Only floats flow through the loop; the refrigerant cycle (the one call into
+    CoolProp) is reached through the solve_cycle callback.
+
+    Returns:
+        (iterations, T_evap, T_cond, t_cw_out, cycle_result)
+    """
+    T_evap = t_chw_supply - 5.0
+    T_cond = t_cw_in + 5.0
+
+    for iteration in range(max_iter):
+        T_evap_old = T_evap
+        T_cond_old = T_cond
+
+        try:
+            cycle_result = solve_cycle(
+                T_evap_C=T_evap, T_cond_C=T_cond, Q_evap_required=q_evap
+            )
+        except Exception as e:
+            raise ValueError(f"Refrigeration cycle solution failed at iteration {iteration}: {e}")
+
+        # Pinch control on a fixed 0.5 / 0.3 °C grid. A pinch moves by at most
+        # one °C per °C of saturation temperature (exactly one on the evaporator
+        # side), so the number of grid steps needed is taken in a single jump
+        # without ever passing the first grid point that satisfies the pinch.
+        # Written branch-free: at most one of the two clipped terms is non-zero.
+        pinch_evap = t_chw_supply - T_evap
+        T_evap += (0.3 * math.ceil(max(pinch_evap - 8.0, 0.0) / 0.3)
+                   - 0.5 * math.ceil(max(3.0 - pinch_evap, 0.0) / 0.5))
+
+        t_cw_out = t_cw_in + cycle_result["Q_cond_W"] / mcp_cw
+
+        pinch_cond = T_cond - t_cw_out
+        T_cond += (0.5 * math.ceil(max(3.0 - pinch_cond, 0.0) / 0.5)
+                   - 0.3 * math.ceil(max(pinch_cond - 8.0, 0.0) / 0.3))
+
+        delta_T_evap = abs(T_evap - T_evap_old)
+        delta_T_cond = abs(T_cond - T_cond_old)
+
+        if delta_T_evap < tolerance and delta_T_cond < tolerance:
+            return iteration + 1, T_evap, T_cond, t_cw_out, cycle_result
+
+    raise ValueError(
+        f"Chiller solution did not converge after {max_iter} iterations. "
+        f"Last changes: ΔT_evap={delta_T_evap:.3f}°C, ΔT_cond={delta_T_cond:.3f}°C"
+    )
+
+
 class Chiller:
     """
     Water-cooled chiller using vapor compression refrigeration cycle.
     水冷式冷水机组（采用蒸汽压缩制冷循环）
     """
 
+    __slots__ = ("rated_capacity", "rated_cop", "t_chw_supply",
+                 "refrigerant", "ref_cycle", "evap_hx", "cond_hx")
+
     def __init__(self, rated_capacity_mw, rated_cop, t_chw_supply, refrigerant="R134a",
                  eta_is_comp=0.80, evap_effectiveness=0.85, cond_effectiveness=0.85, curves_file=None):
         if not COOLPROP_AVAILABLE:
             raise ImportError("CoolProp is required for refrigeration cycle modeling. "
                             "Install with: pip install CoolProp")
 
-        if rated_capacity_mw <= 0:
-            raise ValueError(f"Invalid rated_capacity_mw: {rated_capacity_mw}, must be > 0")
-        if rated_cop <= 0 or rated_cop > 10:
-            raise ValueError(f"Invalid rated_cop: {rated_cop}, must be between 0 and 10")
-        if t_chw_supply < 0 or t_chw_supply >= 30:
-            raise ValueError(f"Invalid t_chw_supply: {t_chw_supply}, must be between 0 and 30 °C")
+        _check_rated_capacity(rated_capacity_mw)
+        _check_rated_cop(rated_cop)
+        _check_t_chw_supply(t_chw_supply)
 
         self.rated_capacity = rated_capacity_mw * 1e6
         self.rated_cop = rated_cop
         self.t_chw_supply = t_chw_supply
-        self.cp_water = 4186
 
         self.refrigerant = refrigerant
         self.ref_cycle = VaporCompressionCycle(
@@ -408,96 +676,274 @@ class Chiller:
             raise ValueError(f"Invalid m_dot_cw: {m_dot_cw}, must be > 0")
 
         if t_chw_return is None:
-            delta_t_chw = q_evap / (m_dot_chw * self.cp_water)
+            delta_t_chw = q_evap / (m_dot_chw * _CP_WATER_J_PER_KG_K)
             t_chw_return = self.t_chw_supply + delta_t_chw
 
-        T_evap = self.t_chw_supply - 5.0
+        iterations, T_evap, T_cond, t_cw_out, cycle_result = _chiller_pinch_loop(
+            self.ref_cycle.solve, q_evap, self.t_chw_supply, t_cw_in,
+            m_dot_cw * _CP_WATER_J_PER_KG_K, max_iter, tolerance,
+        )
+
+        q_cond_ref = cycle_result["Q_cond_W"]
+        w_comp = cycle_result["W_comp_W"]
+
+        return ChillerResult(
+            component="Chiller (Thermodynamic Cycle)",
+            refrigerant=self.refrigerant,
+            converged=True,
+            iterations=iterations,
+            Q_evap_MW=q_evap / 1e6,
+            Q_cond_MW=q_cond_ref / 1e6,
+            W_comp_MW=w_comp / 1e6,
+            Q_cond_W=q_cond_ref,
+            W_comp_W=w_comp,
+            COP=cycle_result["COP"],
+            PLR=q_evap / self.rated_capacity,
+            T_chw_supply_C=self.t_chw_supply,
+            T_chw_return_C=t_chw_return,
+            delta_T_chw_C=t_chw_return - self.t_chw_supply,
+            m_dot_chw_kg_s=m_dot_chw,
+            T_cw_in_C=t_cw_in,
+            T_cw_out_C=t_cw_out,
+            delta_T_cw_C=t_cw_out - t_cw_in,
+            m_dot_cw_kg_s=m_dot_cw,
+            T_evap_sat_C=T_evap,
+            T_cond_sat_C=T_cond,
+            m_dot_ref_kg_s=cycle_result["m_dot_ref_kg_s"],
+            P_evap_kPa=cycle_result["P_evap_Pa"] / 1000,
+            P_cond_kPa=cycle_result["P_cond_Pa"] / 1000,
+            compression_ratio=cycle_result["compression_ratio"],
+            energy_balance_error_pct=abs(q_cond_ref - (q_evap + w_comp)) / q_cond_ref * 100,
+            evap_effectiveness=self.evap_hx.effectiveness,
+            cond_effectiveness=self.cond_hx.effectiveness,
+        )
+
+    def solve_energy_balance_batch(self, q_evap, m_dot_chw, m_dot_cw, t_cw_in,
+                                   t_chw_return=None, max_iter=20, tolerance=0.1):
+        """
+        Array version of solve_energy_balance: one lane per operating point.
+        批量求解冷水机组能量平衡（每个工况一个通道）
+
+        The refrigeration cycle is evaluated point by point for the lanes that are
+        still iterating; the pinch updates and convergence checks act on whole arrays.
+        """
+        if t_chw_return is None:
+            q_evap, m_dot_chw, m_dot_cw, t_cw_in = _broadcast_lanes(q_evap, m_dot_chw, m_dot_cw, t_cw_in)
+        else:
+            q_evap, m_dot_chw, m_dot_cw, t_cw_in, t_chw_return = _broadcast_lanes(
+                q_evap, m_dot_chw, m_dot_cw, t_cw_in, t_chw_return
+            )
+
+        if np.any(q_evap <= 0):
+            raise ValueError(f"Invalid q_evap: {q_evap[q_evap <= 0]}, must be > 0")
+        if np.any(m_dot_chw <= 0):
+            raise ValueError(f"Invalid m_dot_chw: {m_dot_chw[m_dot_chw <= 0]}, must be > 0")
+        if np.any(m_dot_cw <= 0):
+            raise ValueError(f"Invalid m_dot_cw: {m_dot_cw[m_dot_cw <= 0]}, must be > 0")
+
+        if t_chw_return is None:
+            t_chw_return = self.t_chw_supply + q_evap / (m_dot_chw * _CP_WATER_J_PER_KG_K)
+
+        # Loop invariants
+        t_chw_supply = self.t_chw_supply
+        mcp_cw = m_dot_cw * _CP_WATER_J_PER_KG_K
+        solve_cycle = self.ref_cycle.solve
+
+        n = q_evap.shape[0]
+        T_evap = np.full(n, t_chw_supply - 5.0)
         T_cond = t_cw_in + 5.0
+        q_cond_ref = np.empty(n)
+        w_comp = np.empty(n)
+        m_dot_ref = np.empty(n)
+        cop = np.empty(n)
+        p_evap = np.empty(n)
+        p_cond = np.empty(n)
+        iterations = np.zeros(n, dtype=np.int64)
+        active = np.ones(n, dtype=bool)
 
         for iteration in range(max_iter):
-            T_evap_old = T_evap
-            T_cond_old = T_cond
-
-            try:
-                cycle_result = self.ref_cycle.solve(
-                    T_evap_C=T_evap, T_cond_C=T_cond, Q_evap_required=q_evap
-                )
-            except Exception as e:
-                raise ValueError(f"Refrigeration cycle solution failed at iteration {iteration}: {e}")
-
-            m_dot_ref = cycle_result["m_dot_ref_kg_s"]
-            q_cond_ref = cycle_result["Q_cond_W"]
-            w_comp = cycle_result["W_comp_W"]
-
-            T_ref_evap_out = self.ref_cycle.state1.T_C
-            pinch_evap = self.t_chw_supply - T_evap
-            if pinch_evap < 3.0:
-                T_evap -= 0.5
-            elif pinch_evap > 8.0:
-                T_evap += 0.3
-
-            T_ref_cond_in = self.ref_cycle.state2.T_C
-            T_ref_cond_out = self.ref_cycle.state3.T_C
-
-            t_cw_out = t_cw_in + q_cond_ref / (m_dot_cw * self.cp_water)
-
-            pinch_cond = T_cond - t_cw_out
-            if pinch_cond < 3.0:
-                T_cond += 0.5
-            elif pinch_cond > 8.0:
-                T_cond -= 0.3
-
-            evap_effectiveness = 0.85
-            cond_effectiveness = 0.85
-
-            delta_T_evap = abs(T_evap - T_evap_old)
-            delta_T_cond = abs(T_cond - T_cond_old)
-
-            if delta_T_evap < tolerance and delta_T_cond < tolerance:
-                cop = cycle_result["COP"]
-                plr = q_evap / self.rated_capacity
-
-                return {
-                    "component": "Chiller (Thermodynamic Cycle)",
-                    "refrigerant": self.refrigerant,
-                    "converged": True,
-                    "iterations": iteration + 1,
-                    "Q_evap_MW": q_evap / 1e6,
-                    "Q_cond_MW": q_cond_ref / 1e6,
-                    "W_comp_MW": w_comp / 1e6,
-                    "COP": cop,
-                    "PLR": plr,
-                    "T_chw_supply_C": self.t_chw_supply,
-                    "T_chw_return_C": t_chw_return,
-                    "delta_T_chw_C": t_chw_return - self.t_chw_supply,
-                    "m_dot_chw_kg_s": m_dot_chw,
-                    "T_cw_in_C": t_cw_in,
-                    "T_cw_out_C": t_cw_out,
-                    "delta_T_cw_C": t_cw_out - t_cw_in,
-                    "m_dot_cw_kg_s": m_dot_cw,
-                    "T_evap_sat_C": T_evap,
-                    "T_cond_sat_C": T_cond,
-                    "m_dot_ref_kg_s": m_dot_ref,
-                    "P_evap_kPa": cycle_result["P_evap_Pa"] / 1000,
-                    "P_cond_kPa": cycle_result["P_cond_Pa"] / 1000,
-                    "compression_ratio": cycle_result["compression_ratio"],
-                    "energy_balance_error_pct": abs(q_cond_ref - (q_evap + w_comp)) / q_cond_ref * 100,
-                    "evap_effectiveness": evap_effectiveness,
-                    "cond_effectiveness": cond_effectiveness,
-                }
-
-        raise ValueError(
-            f"Chiller solution did not converge after {max_iter} iterations. "
-            f"Last changes: ΔT_evap={delta_T_evap:.3f}°C, ΔT_cond={delta_T_cond:.3f}°C"
-        )
+            idx = np.flatnonzero(active)
+
+            for i in idx:
+                try:
+                    cycle_result = solve_cycle(
+                        T_evap_C=T_evap[i], T_cond_C=T_cond[i], Q_evap_required=q_evap[i]
+                    )
+                except Exception as e:
+                    raise ValueError(f"Refrigeration cycle solution failed at iteration {iteration}: {e}")
+                q_cond_ref[i] = cycle_result["Q_cond_W"]
+                w_comp[i] = cycle_result["W_comp_W"]
+                m_dot_ref[i] = cycle_result["m_dot_ref_kg_s"]
+                cop[i] = cycle_result["COP"]
+                p_evap[i] = cycle_result["P_evap_Pa"]
+                p_cond[i] = cycle_result["P_cond_Pa"]
+
+            # Same grid jumps as the scalar solver, taken for every active lane at once
+            pinch_evap = t_chw_supply - T_evap[idx]
+            step_evap = (0.3 * np.ceil(np.maximum(pinch_evap - 8.0, 0.0) / 0.3)
+                         - 0.5 * np.ceil(np.maximum(3.0 - pinch_evap, 0.0) / 0.5))
+
+            t_cw_out = t_cw_in[idx] + q_cond_ref[idx] / mcp_cw[idx]
+            pinch_cond = T_cond[idx] - t_cw_out
+            step_cond = (0.5 * np.ceil(np.maximum(3.0 - pinch_cond, 0.0) / 0.5)
+                         - 0.3 * np.ceil(np.maximum(pinch_cond - 8.0, 0.0) / 0.3))
+
+            T_evap[idx] += step_evap
+            T_cond[idx] += step_cond
+            iterations[idx] = iteration + 1
+
+            done = (np.abs(step_evap) < tolerance) & (np.abs(step_cond) < tolerance)
+            active[idx[done]] = False
+            if not active.any():
+                break
+        else:
+            raise ValueError(
+                f"Chiller solution did not converge after {max_iter} iterations "
+                f"for {np.count_nonzero(active)} of {n} operating points"
+            )
+
+        t_cw_out = t_cw_in + q_cond_ref / mcp_cw
+
+        return {
+            "converged": ~active,
+            "iterations": iterations,
+            "Q_evap_W": q_evap,
+            "Q_cond_W": q_cond_ref,
+            "W_comp_W": w_comp,
+            "COP": cop,
+            "PLR": q_evap / self.rated_capacity,
+            "T_chw_return_C": t_chw_return,
+            "T_cw_in_C": t_cw_in,
+            "T_cw_out_C": t_cw_out,
+            "T_evap_sat_C": T_evap,
+            "T_cond_sat_C": T_cond,
+            "m_dot_ref_kg_s": m_dot_ref,
+            "P_evap_kPa": p_evap / 1000,
+            "P_cond_kPa": p_cond / 1000,
+            "compression_ratio": p_cond / p_evap,
+            "energy_balance_error_pct": np.abs(q_cond_ref - q_evap - w_comp) * (100.0 / q_cond_ref),
+        }
 
 
 # ============================================================================
 # COOLING TOWER - Heat Rejection to Ambient
 # ============================================================================
 
-# Import psychrometrics for cooling tower calculations
-from psychrometrics import MoistAir, PsychrometricState
+_TOWER_FAN_POWER_FRACTION = 0.007
+
+# Record layout of CoolingTower.solve_batch results: the float fields of
+# CoolingTowerResult, one record per operating point
+_TOWER_BATCH_DTYPE = np.dtype([(name, "f8") for name in (
+    "Q_cond_MW",
+    "Q_water_MW",
+    "Q_air_MW",
+    "T_water_in_C",
+    "T_water_out_C",
+    "Range_C",
+    "Approach_C",
+    "m_dot_cw_kg_s",
+    "T_db_in_C",
+    "T_wb_in_C",
+    "T_db_out_C",
+    "RH_in",
+    "RH_out",
+    "w_in_kg_kg",
+    "w_out_kg_kg",
+    "h_in_J_kg",
+    "h_out_J_kg",
+    "m_dot_da_kg_s",
+    "air_to_water_ratio",
+    "air_to_water_ratio_design",
+    "m_evap_kg_s",
+    "m_evap_energy_kg_s",
+    "m_drift_kg_s",
+    "m_blowdown_kg_s",
+    "m_makeup_kg_s",
+    "m_makeup_L_s",
+    "m_makeup_L_hr",
+    "COC",
+    "W_fan_MW",
+    "W_fan_W",
+    "energy_balance_error_pct",
+)])
+
+
+def _tower_balance_kernel(q_cond, m_dot_cw, cp_water, h_fg, drift_rate, coc,
+                          delta_t, h_in, h_out, w_in, w_out, fan_frac, verify=False):
+    """
+    Water/air mass and energy balance of the tower from plain floats.
+    冷却塔水侧/空气侧质量与能量平衡（纯浮点运算）
+
+    The air flow is sized from the water-side heat, so the air-side heat equals
+    it by construction; it is only recomputed (with the balance error) when
+    verify is set, otherwise q_air = q_water and the error is zero.
+
+    Returns:
+        (q_water, q_air, m_dot_da, air_to_water_ratio, m_evap, m_evap_energy,
+         m_drift, m_blowdown, m_makeup, w_fan, energy_balance_error_pct)
+    """
+    q_water = m_dot_cw * cp_water * delta_t
+    m_dot_da = q_water / (h_out - h_in)
+    air_to_water_ratio = m_dot_da * (1 + w_in) / m_dot_cw
+
+    m_evap = m_dot_da * (w_out - w_in)
+    m_evap_energy = q_cond / h_fg
+    m_drift = drift_rate * m_dot_cw
+    m_blowdown = m_evap / (coc - 1)
+    m_makeup = m_evap + m_drift + m_blowdown
+
+    if verify:
+        q_air = m_dot_da * (h_out - h_in)
+        energy_balance_error = abs(q_water - q_air) / q_water * 100
+    else:
+        q_air = q_water
+        energy_balance_error = q_water * 0.0  # zero, shaped like the inputs
+    w_fan = q_cond * fan_frac
+
+    return (q_water, q_air, m_dot_da, air_to_water_ratio, m_evap, m_evap_energy,
+            m_drift, m_blowdown, m_makeup, w_fan, energy_balance_error)
+
+
+@dataclass(slots=True, frozen=True)
+class CoolingTowerResult(_DictCompatResult):
+    """
+    Cooling tower operating point returned by CoolingTower.solve.
+    冷却塔求解结果
+    """
+    component: str
+    Q_cond_MW: float
+    Q_water_MW: float
+    Q_air_MW: float
+    T_water_in_C: float
+    T_water_out_C: float
+    Range_C: float
+    Approach_C: float
+    m_dot_cw_kg_s: float
+    T_db_in_C: float
+    T_wb_in_C: float
+    T_db_out_C: float
+    RH_in: float
+    RH_out: float
+    w_in_kg_kg: float
+    w_out_kg_kg: float
+    h_in_J_kg: float
+    h_out_J_kg: float
+    m_dot_da_kg_s: float
+    air_to_water_ratio: float
+    air_to_water_ratio_design: float
+    m_evap_kg_s: float
+    m_evap_energy_kg_s: float
+    m_drift_kg_s: float
+    m_blowdown_kg_s: float
+    m_makeup_kg_s: float
+    m_makeup_L_s: float
+    m_makeup_L_hr: float
+    COC: float
+    W_fan_MW: float
+    W_fan_W: float
+    energy_balance_error_pct: float
+    air_inlet_state: PsychrometricState
+    air_outlet_state: PsychrometricState
 
 
 class CoolingTower:
@@ -506,11 +952,11 @@ class CoolingTower:
     诱导通风冷却塔（采用湿空气分析）
     """
 
+    __slots__ = ("approach", "coc", "drift_rate", "air_to_water_ratio", "h_fg")
+
     def __init__(self, approach_temp, coc, drift_rate=0.00001, air_to_water_ratio=1.2):
-        if approach_temp <= 0 or approach_temp > 20:
-            raise ValueError(f"Invalid approach_temp: {approach_temp}, must be between 0 and 20 °C")
-        if coc < 2 or coc > 10:
-            raise ValueError(f"Invalid coc: {coc}, must be between 2 and 10")
+        _check_approach(approach_temp)
+        _check_coc(coc)
         if drift_rate < 0 or drift_rate > 0.01:
             raise ValueError(f"Invalid drift_rate: {drift_rate}, must be between 0 and 0.01")
         if air_to_water_ratio <= 0 or air_to_water_ratio > 5:
@@ -520,7 +966,6 @@ class CoolingTower:
         self.coc = coc
         self.drift_rate = drift_rate
         self.air_to_water_ratio = air_to_water_ratio
-        self.cp_water = 4186
         self.h_fg = 2260e3
 
     def calculate_outlet_temp(self, t_wb):
@@ -528,6 +973,20 @@ class CoolingTower:
             raise ValueError(f"Invalid t_wb: {t_wb}, must be between -20 and 50 C")
         return t_wb + self.approach
 
+    def estimate_water_out(self, q_cond, m_dot_cw, t_wb):
+        """
+        Estimate the leaving water temperature before the loop is solved.
+        在迭代前估计出水温度（用作初值）
+
+        With a fixed approach and air/water ratio the model's outlet does not
+        depend on the heat rejected, so the estimate is the converged value.
+        Returns None if no finite estimate exists, so callers can fall back.
+        """
+        if q_cond <= 0 or m_dot_cw <= 0:
+            return None
+        t_out = self.calculate_outlet_temp(t_wb)
+        return t_out if math.isfinite(t_out) else None
+
     def calculate_evaporation_rate(self, q_cond, m_dot_cw, delta_t):
         m_evap = q_cond / self.h_fg
         return m_evap
@@ -542,10 +1001,36 @@ class CoolingTower:
         return m_evap + m_drift + m_blowdown
 
     def calculate_fan_power(self, q_cond):
-        fan_power_fraction = 0.007
-        return q_cond * fan_power_fraction
+        return q_cond * _TOWER_FAN_POWER_FRACTION
+
+    def air_states(self, t_wb, t_db=None):
+        """
+        Inlet (ambient) and outlet (95% RH at tower outlet temperature) air states.
+        冷却塔进出口空气状态
+
+        Both depend only on the ambient conditions, so a caller iterating on the
+        water side can build them once and pass them to solve().
+        """
+        t_out = self.calculate_outlet_temp(t_wb)
+
+        if t_db is None:
+            t_db = t_wb + 10.0
+
+        # Shared (immutable) states, reused across towers and operating points
+        try:
+            air_in = PsychrometricState.cached(T_db_C=t_db, T_wb_C=t_wb)
+        except Exception as e:
+            raise ValueError(f"Failed to calculate air inlet state: {e}")
+
+        try:
+            air_out = PsychrometricState.cached(T_db_C=t_out, RH=0.95)
+        except Exception as e:
+            raise ValueError(f"Failed to calculate air outlet state: {e}")
 
-    def solve(self, q_cond, m_dot_cw, t_in, t_wb, t_db=None, RH_in=None):
+        return air_in, air_out
+
+    def solve(self, q_cond, m_dot_cw, t_in, t_wb, t_db=None, RH_in=None,
+              air_in_state=None, air_out_state=None, verify=False):
         if q_cond <= 0:
             raise ValueError(f"Invalid q_cond: {q_cond}, must be > 0")
         if m_dot_cw <= 0:
@@ -559,93 +1044,406 @@ class CoolingTower:
         if delta_t <= 0:
             raise ValueError(f"Water inlet temp {t_in}°C must be > outlet temp {t_out}°C")
 
+        if air_in_state is None or air_out_state is None:
+            air_in, air_out = self.air_states(t_wb, t_db)
+        else:
+            air_in, air_out = air_in_state, air_out_state
+
+        if air_out.h - air_in.h <= 0:
+            raise ValueError(
+                f"Air enthalpy must increase through tower. "
+                f"h_in={air_in.h:.0f} J/kg, h_out={air_out.h:.0f} J/kg"
+            )
+
+        (q_water, q_air, m_dot_da, actual_air_to_water_ratio, m_evap, m_evap_energy,
+         m_drift, m_blowdown, m_makeup, w_fan, energy_balance_error) = _tower_balance_kernel(
+            q_cond, m_dot_cw, _CP_WATER_J_PER_KG_K, self.h_fg, self.drift_rate, self.coc,
+            delta_t, air_in.h, air_out.h, air_in.w, air_out.w, _TOWER_FAN_POWER_FRACTION,
+            verify,
+        )
+
+        if verify and energy_balance_error > 5.0:
+            warnings.warn(
+                f"Cooling tower energy balance error {energy_balance_error:.1f}% exceeds 5%. "
+                f"This suggests numerical issues in psychrometric calculations."
+            )
+
+        return CoolingTowerResult(
+            component="Cooling Tower (Psychrometric)",
+            Q_cond_MW=q_cond / 1e6,
+            Q_water_MW=q_water / 1e6,
+            Q_air_MW=q_air / 1e6,
+            T_water_in_C=t_in,
+            T_water_out_C=t_out,
+            Range_C=delta_t,
+            Approach_C=self.approach,
+            m_dot_cw_kg_s=m_dot_cw,
+            T_db_in_C=air_in.T_db,
+            T_wb_in_C=t_wb,
+            T_db_out_C=air_out.T_db,
+            RH_in=air_in.RH,
+            RH_out=air_out.RH,
+            w_in_kg_kg=air_in.w,
+            w_out_kg_kg=air_out.w,
+            h_in_J_kg=air_in.h,
+            h_out_J_kg=air_out.h,
+            m_dot_da_kg_s=m_dot_da,
+            air_to_water_ratio=actual_air_to_water_ratio,
+            air_to_water_ratio_design=self.air_to_water_ratio,
+            m_evap_kg_s=m_evap,
+            m_evap_energy_kg_s=m_evap_energy,
+            m_drift_kg_s=m_drift,
+            m_blowdown_kg_s=m_blowdown,
+            m_makeup_kg_s=m_makeup,
+            m_makeup_L_s=m_makeup,
+            m_makeup_L_hr=m_makeup * 3600,
+            COC=self.coc,
+            W_fan_MW=w_fan / 1e6,
+            W_fan_W=w_fan,
+            energy_balance_error_pct=energy_balance_error,
+            air_inlet_state=air_in,
+            air_outlet_state=air_out,
+        )
+
+    def solve_batch(self, q_cond, m_dot_cw, t_in, t_wb, t_db=None, verify=False,
+                    dtype=np.float64):
+        """
+        Array version of solve: one element per operating point (inputs broadcast).
+        冷却塔批量求解（输入按NumPy规则广播，每个元素对应一个工况）
+
+        Every step runs on whole arrays: the inlet and outlet psychrometric states
+        (same formulas as PsychrometricState) and the water/air balance.
+        verify=True recomputes the air-side heat and checks the energy balance.
+        dtype=np.float32 runs the whole batch in single precision (inputs are
+        cast once, constants stay weakly typed) for large, memory-bound sweeps;
+        results then agree with float64 to roughly 1e-4 relative.
+
+        Returns:
+            NumPy record array (dtype _TOWER_BATCH_DTYPE) with the float fields
+            of solve(), readable as result.m_evap_kg_s or result["m_evap_kg_s"]
+        """
         if t_db is None:
+            q_cond, m_dot_cw, t_in, t_wb = _broadcast_lanes(q_cond, m_dot_cw, t_in, t_wb, dtype=dtype)
             t_db = t_wb + 10.0
+        else:
+            q_cond, m_dot_cw, t_in, t_wb, t_db = _broadcast_lanes(
+                q_cond, m_dot_cw, t_in, t_wb, t_db, dtype=dtype
+            )
 
+        if np.any(q_cond <= 0):
+            raise ValueError(f"Invalid q_cond: {q_cond[q_cond <= 0]}, must be > 0")
+        if np.any(m_dot_cw <= 0):
+            raise ValueError(f"Invalid m_dot_cw: {m_dot_cw[m_dot_cw <= 0]}, must be > 0")
+        bad = (t_in < 0) | (t_in >= 100)
+        if np.any(bad):
+            raise ValueError(f"Invalid t_in: {t_in[bad]}, must be between 0 and 100 °C")
+        bad = (t_wb < -20) | (t_wb > 50)
+        if np.any(bad):
+            raise ValueError(f"Invalid t_wb: {t_wb[bad]}, must be between -20 and 50 C")
+
+        t_out = t_wb + self.approach
+        delta_t = t_in - t_out
+        if np.any(delta_t <= 0):
+            raise ValueError(
+                f"Water inlet temp must be > outlet temp; violated at "
+                f"{np.count_nonzero(delta_t <= 0)} operating points"
+            )
+
+        n = q_cond.shape[0]
         try:
-            air_in = PsychrometricState(T_db_C=t_db, T_wb_C=t_wb)
-        except Exception as e:
+            w_in, h_in, rh_in = MoistAir.air_state_arrays(t_db, T_wb_C=t_wb)
+        except ValueError as e:
             raise ValueError(f"Failed to calculate air inlet state: {e}")
-
         try:
-            air_out = PsychrometricState(T_db_C=t_out, RH=0.95)
-        except Exception as e:
+            w_out, h_out, rh_out = MoistAir.air_state_arrays(t_out, RH=0.95)
+        except ValueError as e:
             raise ValueError(f"Failed to calculate air outlet state: {e}")
 
-        q_water = m_dot_cw * self.cp_water * delta_t
+        if np.any(h_out - h_in <= 0):
+            raise ValueError(
+                f"Air enthalpy must increase through tower; violated at "
+                f"{np.count_nonzero(h_out - h_in <= 0)} operating points"
+            )
 
-        delta_h_air = air_out.h - air_in.h
+        (q_water, q_air, m_dot_da, actual_air_to_water_ratio, m_evap, m_evap_energy,
+         m_drift, m_blowdown, m_makeup, w_fan, energy_balance_error) = _tower_balance_kernel(
+            q_cond, m_dot_cw, _CP_WATER_J_PER_KG_K, self.h_fg, self.drift_rate, self.coc,
+            delta_t, h_in, h_out, w_in, w_out, _TOWER_FAN_POWER_FRACTION,
+            verify,
+        )
 
-        if delta_h_air <= 0:
-            raise ValueError(
-                f"Air enthalpy must increase through tower. "
-                f"h_in={air_in.h:.0f} J/kg, h_out={air_out.h:.0f} J/kg"
+        if verify and np.any(energy_balance_error > 5.0):
+            warnings.warn(
+                f"Cooling tower energy balance error exceeds 5% at "
+                f"{np.count_nonzero(energy_balance_error > 5.0)} operating points "
+                f"(max {energy_balance_error.max():.1f}%). "
+                f"This suggests numerical issues in psychrometric calculations."
             )
 
-        m_dot_da = q_water / delta_h_air
+        if q_cond.dtype == _TOWER_BATCH_DTYPE[0]:
+            record = _TOWER_BATCH_DTYPE
+        else:
+            record = np.dtype([(name, q_cond.dtype) for name in _TOWER_BATCH_DTYPE.names])
+        out = np.empty(n, dtype=record)
+        out["Q_cond_MW"] = q_cond / 1e6
+        out["Q_water_MW"] = q_water / 1e6
+        out["Q_air_MW"] = q_air / 1e6
+        out["T_water_in_C"] = t_in
+        out["T_water_out_C"] = t_out
+        out["Range_C"] = delta_t
+        out["Approach_C"] = self.approach
+        out["m_dot_cw_kg_s"] = m_dot_cw
+        out["T_db_in_C"] = t_db
+        out["T_wb_in_C"] = t_wb
+        out["T_db_out_C"] = t_out
+        out["RH_in"] = rh_in
+        out["RH_out"] = rh_out
+        out["w_in_kg_kg"] = w_in
+        out["w_out_kg_kg"] = w_out
+        out["h_in_J_kg"] = h_in
+        out["h_out_J_kg"] = h_out
+        out["m_dot_da_kg_s"] = m_dot_da
+        out["air_to_water_ratio"] = actual_air_to_water_ratio
+        out["air_to_water_ratio_design"] = self.air_to_water_ratio
+        out["m_evap_kg_s"] = m_evap
+        out["m_evap_energy_kg_s"] = m_evap_energy
+        out["m_drift_kg_s"] = m_drift
+        out["m_blowdown_kg_s"] = m_blowdown
+        out["m_makeup_kg_s"] = m_makeup
+        out["m_makeup_L_s"] = m_makeup
+        out["m_makeup_L_hr"] = m_makeup * 3600
+        out["COC"] = self.coc
+        out["W_fan_MW"] = w_fan / 1e6
+        out["W_fan_W"] = w_fan
+        out["energy_balance_error_pct"] = energy_balance_error
+        return out.view(np.recarray)
 
-        actual_air_to_water_ratio = m_dot_da * (1 + air_in.w) / m_dot_cw
 
-        m_evap_air = m_dot_da * (air_out.w - air_in.w)
-        m_evap_energy = q_cond / self.h_fg
-        m_evap = m_evap_air
+# ============================================================================
+# INTEGRATED COOLING SYSTEM - Complete Integration
+# ============================================================================
 
-        m_drift = self.calculate_drift_loss(m_dot_cw)
-        m_blowdown = self.calculate_blowdown_rate(m_evap)
-        m_makeup = self.calculate_makeup_water(m_evap, m_drift, m_blowdown)
+# Whole-system solutions keyed on (CoolingSystem._design_key(), exact operating
+# point). Every design parameter is part of the key, so a changed chiller, tower,
+# pump or solver setting can never return a stale result, and systems with equal
+# designs share solutions.
+_SOLVE_CACHE = {}
+_SOLVE_CACHE_SIZE = 4096
 
-        q_air = m_dot_da * (air_out.h - air_in.h)
-        energy_balance_error = abs(q_water - q_air) / q_water * 100
 
-        if energy_balance_error > 5.0:
-            import warnings
-            warnings.warn(
-                f"Cooling tower energy balance error {energy_balance_error:.1f}% exceeds 5%. "
-                f"This suggests numerical issues in psychrometric calculations."
-            )
+def _secant_fixed_point(evaluate, t, t_floor, tol, max_iter):
+    """
+    Solve the condenser-water fixed point t = g(t).
+    冷却水温度不动点求解（割线法加速）
+
+    evaluate(t) returns (g(t), *payload). Secant (Newton) steps on the residual
+    r(t) = g(t) - t are taken once two residuals are known, plain Picard steps
+    otherwise. Over the last three iterates this is the same extrapolation as
+    Aitken's delta-squared. Extrapolated steps are clamped to
+    [t_floor, g(t) + 2 °C], a window anchored on the latest Picard iterate
+    rather than on the extrapolation base. Only floats are carried through the
+    loop; the component models sit behind the callback.
+
+    Returns:
+        (converged t, iterations, final residual g(t) - t, payload of the last
+        evaluation)
+    """
+    tol_sq = tol * tol
+    t_prev = r_prev = None
+    for iteration in range(max_iter):
+        # Steps 1-2: chiller and cooling tower
+        t_new, *payload = evaluate(t)
+
+        # Step 3: Check convergence
+        r = t_new - t
+        if r * r < tol_sq:
+            return t_new, iteration + 1, r, payload
+
+        # Step 4: Next iterate (extrapolated, clamped to the acceptance window)
+        t_next = t_new
+        if r_prev is not None and abs(r - r_prev) >= 1e-9:
+            t_acc = t - r * (t - t_prev) / (r - r_prev)
+            t_next = min(max(t_acc, t_floor), t_new + 2.0)
+
+        t_prev, r_prev = t, r
+        t = t_next
+
+    raise ValueError(
+        f"Cooling system did not converge after {max_iter} iterations. "
+        f"Last ΔT = {abs(r):.3f}°C"
+    )
+
 
-        w_fan = self.calculate_fan_power(q_cond)
+@dataclass(slots=True, frozen=True)
+class CoolingSystemResult:
+    """
+    Result of CoolingSystem.solve for one operating point.
+    单工况冷却系统求解结果
+
+    Headline values are plain fields and the component results are kept as
+    returned by the chiller, tower and pump. The nested dict layout
+    (downstream_interface / internal_states) is only built on request, via
+    to_dict() or result["downstream_interface"] / result["internal_states"].
+    """
+    T_chw_supply_C: float
+    T_chw_return_C: float
+    m_dot_chw_kg_s: float
+    Q_cooling_W: float
+    system_COP: float
+    total_power_W: float
+    m_dot_cw_kg_s: float
+    T_cw_from_tower_C: float
+    T_wb_ambient_C: float
+    iterations: int
+    chiller: ChillerResult
+    cooling_tower: CoolingTowerResult
+    pump: PumpSystemResult
+    verbose: bool = True
+    final_temp_diff_C: float = 0.0
+    converged: bool = True
 
+    @property
+    def total_power_MW(self):
+        return self.total_power_W / 1e6
+
+    def downstream_interface(self) -> Dict:
+        """Interface values for the building heat exchanger. 下游接口数据"""
         return {
-            "component": "Cooling Tower (Psychrometric)",
-            "Q_cond_MW": q_cond / 1e6,
-            "Q_water_MW": q_water / 1e6,
-            "Q_air_MW": q_air / 1e6,
-            "T_water_in_C": t_in,
-            "T_water_out_C": t_out,
-            "Range_C": delta_t,
-            "Approach_C": self.approach,
-            "m_dot_cw_kg_s": m_dot_cw,
-            "T_db_in_C": air_in.T_db,
-            "T_wb_in_C": t_wb,
-            "T_db_out_C": air_out.T_db,
-            "RH_in": air_in.RH,
-            "RH_out": air_out.RH,
-            "w_in_kg_kg": air_in.w,
-            "w_out_kg_kg": air_out.w,
-            "h_in_J_kg": air_in.h,
-            "h_out_J_kg": air_out.h,
-            "m_dot_da_kg_s": m_dot_da,
-            "air_to_water_ratio": actual_air_to_water_ratio,
-            "air_to_water_ratio_design": self.air_to_water_ratio,
-            "m_evap_kg_s": m_evap,
-            "m_evap_energy_kg_s": m_evap_energy,
-            "m_drift_kg_s": m_drift,
-            "m_blowdown_kg_s": m_blowdown,
-            "m_makeup_kg_s": m_makeup,
-            "m_makeup_L_s": m_makeup,
-            "m_makeup_L_hr": m_makeup * 3600,
-            "COC": self.coc,
-            "W_fan_MW": w_fan / 1e6,
-            "energy_balance_error_pct": energy_balance_error,
-            "air_inlet_state": air_in,
-            "air_outlet_state": air_out,
+            "component": "CoolingSystem",
+            "T_chw_supply_C": self.T_chw_supply_C,
+            "T_chw_return_C": self.T_chw_return_C,
+            "m_dot_chw_kg_s": self.m_dot_chw_kg_s,
+            "Q_cooling_W": self.Q_cooling_W,
+            "Q_cooling_MW": self.Q_cooling_W / 1e6,
+            "deltaT_chw_C": self.T_chw_return_C - self.T_chw_supply_C,
+            "system_COP": self.system_COP,
+            "total_power_W": self.total_power_W,
+            "total_power_MW": self.total_power_W / 1e6,
         }
 
+    def internal_states(self) -> Dict:
+        """Component-level states for diagnostics. 内部状态（用于诊断）"""
+        chiller = self.chiller
+        tower = self.cooling_tower
+        pump = self.pump
+        return {
+            "convergence": {
+                "converged": self.converged,
+                "iterations": self.iterations,
+                "final_temp_diff_C": self.final_temp_diff_C,
+            },
+
+            "chiller": {
+                "Q_evap_MW": chiller.Q_evap_MW,
+                "Q_cond_MW": chiller.Q_cond_MW,
+                "W_comp_MW": chiller.W_comp_MW,
+                "COP": chiller.COP,
+                "PLR": chiller.PLR,
+                "T_evap_sat_C": chiller.T_evap_sat_C,
+                "T_cond_sat_C": chiller.T_cond_sat_C,
+                "P_evap_kPa": chiller.P_evap_kPa,
+                "P_cond_kPa": chiller.P_cond_kPa,
+                "compression_ratio": chiller.compression_ratio,
+                "m_dot_ref_kg_s": chiller.m_dot_ref_kg_s,
+                "refrigerant": chiller.refrigerant,
+            },
+
+            "condenser_water_loop": {
+                "m_dot_cw_kg_s": self.m_dot_cw_kg_s,
+                "T_cw_from_tower_C": self.T_cw_from_tower_C,
+                "T_cw_to_tower_C": chiller.T_cw_out_C,
+                "deltaT_cw_C": chiller.T_cw_out_C - self.T_cw_from_tower_C,
+                "Q_rejected_MW": chiller.Q_cond_MW,
+            },
+
+            "cooling_tower": {
+                "Q_rejected_MW": tower.Q_cond_MW,
+                "T_water_in_C": tower.T_water_in_C,
+                "T_water_out_C": tower.T_water_out_C,
+                "T_wb_ambient_C": self.T_wb_ambient_C,
+                "T_db_ambient_C": tower.T_db_in_C,
+                "approach_C": tower.Approach_C,
+                "range_C": tower.Range_C,
+                "m_dot_air_kg_s": tower.m_dot_da_kg_s,
+                "W_fan_MW": tower.W_fan_MW,
+                "m_evap_kg_s": tower.m_evap_kg_s,
+                "m_makeup_kg_s": tower.m_makeup_kg_s,
+                "m_makeup_L_hr": tower.m_makeup_L_hr,
+                "COC": tower.COC,
+                "RH_in_pct": tower.RH_in * 100,
+                "RH_out_pct": tower.RH_out * 100,
+            },
+
+            "pump": {
+                "P_pump_W": pump.P_pump_W,
+                "P_pump_kW": pump.P_pump_W / 1000,
+                "static_head_m": pump.static_head_m,
+                "efficiency": pump.efficiency,
+            },
+
+            "energy_balance": {
+                "Q_evap_MW": chiller.Q_evap_MW,
+                "W_comp_MW": chiller.W_comp_MW,
+                "Q_cond_MW": chiller.Q_cond_MW,
+                "error_pct": chiller.energy_balance_error_pct,
+            },
+        }
+
+    def keys(self):
+        return ("downstream_interface", "internal_states") if self.verbose else ("downstream_interface",)
+
+    def __contains__(self, key):
+        return key in self.keys()
+
+    def __getitem__(self, key):
+        if key == "downstream_interface":
+            return self.downstream_interface()
+        if key == "internal_states" and self.verbose:
+            return self.internal_states()
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def to_dict(self) -> Dict:
+        """Nested dict in the layout solve() used to return. 转换为原嵌套字典格式"""
+        return {key: self[key] for key in self.keys()}
+
+
+@dataclass(slots=True)
+class CoolingSystemResults:
+    """
+    Structure-of-arrays result of CoolingSystem.solve_batch, one element per operating point.
+    批量求解结果（每个字段为一个数组，每个元素对应一个工况）
+    """
+    T_chw_supply_C: np.ndarray
+    T_chw_return_C: np.ndarray
+    m_dot_chw_kg_s: np.ndarray
+    Q_cooling_W: np.ndarray
+    system_COP: np.ndarray
+    total_power_W: np.ndarray
+    W_comp_W: np.ndarray
+    W_fan_W: np.ndarray
+    P_pump_W: np.ndarray
+    Q_cond_W: np.ndarray
+    T_evap_sat_C: np.ndarray
+    T_cond_sat_C: np.ndarray
+    m_dot_cw_kg_s: np.ndarray
+    T_cw_from_tower_C: np.ndarray
+    T_cw_to_tower_C: np.ndarray
+    m_dot_air_kg_s: np.ndarray
+    m_evap_kg_s: np.ndarray
+    m_makeup_kg_s: np.ndarray
+    energy_balance_error_pct: np.ndarray
+    iterations: int
+
+    def __len__(self):
+        return self.Q_cooling_W.shape[0]
+
+    def to_dict(self) -> Dict:
+        """Plain dict of the result arrays. 转换为字典"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
-# ============================================================================
-# INTEGRATED COOLING SYSTEM - Complete Integration
-# ============================================================================
 
 class CoolingSystem:
     """
@@ -656,6 +1454,9 @@ class CoolingSystem:
     这是向建筑热交换器提供冷却的主类。
     """
 
+    __slots__ = ("chiller", "cooling_tower", "pump_system", "t_chw_supply",
+                 "max_iter", "tol_C")
+
     def __init__(
         self,
         chiller_capacity_MW: float = 1000.0,
@@ -696,7 +1497,81 @@ class CoolingSystem:
         self.t_chw_supply = t_chw_supply_C
         self.max_iter = max_iter
         self.tol_C = tol_C
-        self.cp_water = 4186.0
+
+    def _design_key(self):
+        """Every parameter that affects a solution, used to key _SOLVE_CACHE."""
+        chiller = self.chiller
+        cycle = chiller.ref_cycle
+        tower = self.cooling_tower
+        pump = self.pump_system.cw_pump
+        return (
+            type(chiller), chiller.rated_capacity, chiller.rated_cop, chiller.t_chw_supply,
+            chiller.refrigerant, type(cycle), cycle.refrigerant, cycle.eta_is_comp,
+            cycle.superheat_evap, cycle.subcool_cond,
+            chiller.evap_hx.effectiveness, chiller.evap_hx.fouling_resistance,
+            chiller.cond_hx.effectiveness, chiller.cond_hx.fouling_resistance,
+            type(tower), tower.approach, tower.coc, tower.drift_rate,
+            tower.air_to_water_ratio, tower.h_fg,
+            type(self.pump_system), type(pump), pump.pump_type, pump.static_head,
+            pump.dynamic_head_factor, pump.equipment_head, pump.efficiency,
+            pump.g, pump.rho_water,
+            self.t_chw_supply, self.max_iter, self.tol_C,
+        )
+
+    def update_conditions(
+        self,
+        chiller_capacity_MW: Optional[float] = None,
+        chiller_cop: Optional[float] = None,
+        t_chw_supply_C: Optional[float] = None,
+        tower_approach_C: Optional[float] = None,
+        tower_coc: Optional[float] = None,
+        pump_static_head_m: Optional[float] = None,
+        pump_efficiency: Optional[float] = None,
+        max_iter: Optional[int] = None,
+        tol_C: Optional[float] = None,
+    ) -> "CoolingSystem":
+        """
+        Change design parameters in place, keeping the component objects.
+        原地更新设计参数（保留已创建的部件对象）
+
+        Arguments left as None are unchanged. The refrigerant cycle (and its
+        cached state points) is kept, so a parameter sweep does not rebuild it;
+        changing the refrigerant still requires a new CoolingSystem.
+        """
+        # Validate everything first so a bad argument leaves the system unchanged
+        checks = (
+            (chiller_capacity_MW, _check_rated_capacity),
+            (chiller_cop, _check_rated_cop),
+            (t_chw_supply_C, _check_t_chw_supply),
+            (tower_approach_C, _check_approach),
+            (tower_coc, _check_coc),
+            (pump_static_head_m, _check_static_head),
+            (pump_efficiency, _check_pump_efficiency),
+        )
+        for value, check in checks:
+            if value is not None:
+                check(value)
+
+        if chiller_capacity_MW is not None:
+            self.chiller.rated_capacity = chiller_capacity_MW * 1e6
+        if chiller_cop is not None:
+            self.chiller.rated_cop = chiller_cop
+        if t_chw_supply_C is not None:
+            self.chiller.t_chw_supply = t_chw_supply_C
+            self.t_chw_supply = t_chw_supply_C
+        if tower_approach_C is not None:
+            self.cooling_tower.approach = tower_approach_C
+        if tower_coc is not None:
+            self.cooling_tower.coc = tower_coc
+        if pump_static_head_m is not None:
+            self.pump_system.cw_pump.static_head = pump_static_head_m
+        if pump_efficiency is not None:
+            self.pump_system.cw_pump.efficiency = pump_efficiency
+        if max_iter is not None:
+            self.max_iter = max_iter
+        if tol_C is not None:
+            self.tol_C = tol_C
+        return self
 
     def solve(
         self,
@@ -705,7 +1580,8 @@ class CoolingSystem:
         t_chw_return_C: float,
         t_wb_ambient_C: float,
         t_db_ambient_C: Optional[float] = None,
-    ) -> Dict:
+        verbose: bool = True,
+    ) -> "CoolingSystemResult":
         """
         Solve complete cooling system for given cooling load.
         为给定的冷负荷求解完整的冷却系统
@@ -716,7 +1592,45 @@ class CoolingSystem:
             t_chw_return_C: Chilled water return temperature (°C) 冷冻水回水温度
             t_wb_ambient_C: Ambient wet bulb temperature (°C) 环境湿球温度
             t_db_ambient_C: Ambient dry bulb temperature (°C) 环境干球温度
+            verbose: Expose "internal_states"; with False the result only
+                provides "downstream_interface" 是否输出内部状态
+
+        Returns:
+            CoolingSystemResult. result["downstream_interface"],
+            result["internal_states"] and result.to_dict() give the nested
+            dicts; the headline values are also plain attributes.
+
+        Results are memoized on the exact inputs plus every design parameter,
+        so repeated operating points return the same (immutable) result object
+        and any parameter change, including direct attribute edits on the
+        components, is solved afresh.
+        结果按输入及全部设计参数缓存并共享（结果对象不可变）。
         """
+        # Plain floats for the key: numpy scalars and 0-d arrays are accepted
+        # as before but are not hashable
+        q_cooling_load_W = float(q_cooling_load_W)
+        m_dot_chw_kg_s = float(m_dot_chw_kg_s)
+        t_chw_return_C = float(t_chw_return_C)
+        t_wb_ambient_C = float(t_wb_ambient_C)
+        if t_db_ambient_C is not None:
+            t_db_ambient_C = float(t_db_ambient_C)
+        verbose = bool(verbose)
+
+        key = (self._design_key(), q_cooling_load_W, m_dot_chw_kg_s, t_chw_return_C,
+               t_wb_ambient_C, t_db_ambient_C, verbose)
+        result = _SOLVE_CACHE.get(key)
+        if result is None:
+            result = self._solve_uncached(
+                q_cooling_load_W, m_dot_chw_kg_s, t_chw_return_C,
+                t_wb_ambient_C, t_db_ambient_C, verbose,
+            )
+            if len(_SOLVE_CACHE) >= _SOLVE_CACHE_SIZE:
+                _SOLVE_CACHE.clear()
+            _SOLVE_CACHE[key] = result
+        return result
+
+    def _solve_uncached(self, q_cooling_load_W, m_dot_chw_kg_s, t_chw_return_C,
+                        t_wb_ambient_C, t_db_ambient_C, verbose):
         if q_cooling_load_W <= 0:
             raise ValueError(f"Cooling load must be positive: {q_cooling_load_W}")
         if m_dot_chw_kg_s <= 0:
@@ -727,134 +1641,256 @@ class CoolingSystem:
             )
 
         # Estimate condenser water flow rate
-        deltaT_cw_design = 5.5
-        q_cond_est = q_cooling_load_W * 1.15
-        m_dot_cw = q_cond_est / (self.cp_water * deltaT_cw_design)
+        q_cond_est = q_cooling_load_W * _Q_COND_OVERESTIMATE
+        m_dot_cw = q_cond_est / (_CP_WATER_J_PER_KG_K * _DELTA_T_CW_DESIGN_C)
 
-        # Initial guess for condenser water inlet temperature
-        t_cw_in = t_wb_ambient_C + self.cooling_tower.approach + 0.5
+        # Initial guess for condenser water inlet temperature: the tower model's
+        # own outlet estimate, falling back to approach plus a margin
+        t_cw_in = self.cooling_tower.estimate_water_out(q_cond_est, m_dot_cw, t_wb_ambient_C)
+        if t_cw_in is None:
+            t_cw_in = t_wb_ambient_C + self.cooling_tower.approach + 0.5
 
-        # Iterative solution
-        converged = False
-        for iteration in range(self.max_iter):
-            # Step 1: Solve chiller
+        # Ambient air states do not change during the iteration
+        air_in, air_out = self.cooling_tower.air_states(t_wb_ambient_C, t_db_ambient_C)
+
+        def evaluate(t):
+            """One chiller + tower pass: tower outlet temperature for inlet t."""
             chiller_result = self.chiller.solve_energy_balance(
                 q_evap=q_cooling_load_W,
                 m_dot_chw=m_dot_chw_kg_s,
                 m_dot_cw=m_dot_cw,
-                t_cw_in=t_cw_in,
+                t_cw_in=t,
                 t_chw_return=t_chw_return_C,
             )
-
-            # Step 2: Solve cooling tower
             tower_result = self.cooling_tower.solve(
-                q_cond=chiller_result["Q_cond_MW"] * 1e6,
+                q_cond=chiller_result.Q_cond_W,
                 m_dot_cw=m_dot_cw,
-                t_in=chiller_result["T_cw_out_C"],
+                t_in=chiller_result.T_cw_out_C,
                 t_wb=t_wb_ambient_C,
                 t_db=t_db_ambient_C,
+                air_in_state=air_in,
+                air_out_state=air_out,
             )
+            return tower_result.T_water_out_C, chiller_result, tower_result
 
-            # Step 3: Check convergence
-            t_cw_in_new = tower_result["T_water_out_C"]
+        # Iterative solution (Steps 1-4), bounded below by the approach limit
+        t_cw_in, iterations, diff, (chiller_result, tower_result) = _secant_fixed_point(
+            evaluate, t_cw_in, t_wb_ambient_C + self.cooling_tower.approach,
+            self.tol_C, self.max_iter,
+        )
+        # Lazy %-formatting: nothing is formatted unless DEBUG is enabled
+        logger.debug(
+            "Converged in %d iterations: T_cw_in=%.2f C, COP=%.2f",
+            iterations, t_cw_in, chiller_result.COP,
+        )
 
-            if abs(t_cw_in_new - t_cw_in) < self.tol_C:
-                converged = True
-                t_cw_in = t_cw_in_new
-                break
+        # Step 5: Calculate pump power
+        pump_result = self.pump_system.solve(m_dot_cw=m_dot_cw)
+
+        # Step 6: Package results (power summed once in W, MW derived from it)
+        return CoolingSystemResult(
+            T_chw_supply_C=self.t_chw_supply,
+            T_chw_return_C=t_chw_return_C,
+            m_dot_chw_kg_s=m_dot_chw_kg_s,
+            Q_cooling_W=q_cooling_load_W,
+            system_COP=chiller_result.COP,
+            total_power_W=chiller_result.W_comp_W + pump_result.P_pump_W + tower_result.W_fan_W,
+            m_dot_cw_kg_s=m_dot_cw,
+            T_cw_from_tower_C=t_cw_in,
+            T_wb_ambient_C=t_wb_ambient_C,
+            iterations=iterations,
+            chiller=chiller_result,
+            cooling_tower=tower_result,
+            pump=pump_result,
+            verbose=verbose,
+            final_temp_diff_C=abs(diff),
+            converged=abs(diff) < self.tol_C,
+        )
+
+    def solve_batch(
+        self,
+        q_cooling_load_W,
+        m_dot_chw_kg_s,
+        t_chw_return_C,
+        t_wb_ambient_C,
+        t_db_ambient_C=None,
+    ) -> CoolingSystemResults:
+        """
+        Solve the cooling system for an array of operating points (e.g. 8760 hours).
+        批量求解冷却系统（例如全年8760小时的逐时工况）
 
-            t_cw_in = t_cw_in_new
+        Inputs may be scalars or arrays and are broadcast against each other
+        (N-d inputs are flattened). The outer fixed-point iteration runs on whole
+        arrays, and the tower's psychrometric air states are array-evaluated too
+        (CoolingTower.solve_batch); only the refrigeration cycle (CoolProp) is
+        evaluated point by point.
 
-        if not converged:
+        Args:
+            q_cooling_load_W: Required cooling capacity (W) 需要的冷量
+            m_dot_chw_kg_s: Chilled water mass flow rate (kg/s) 冷冻水流量
+            t_chw_return_C: Chilled water return temperature (°C) 冷冻水回水温度
+            t_wb_ambient_C: Ambient wet bulb temperature (°C) 环境湿球温度
+            t_db_ambient_C: Ambient dry bulb temperature (°C) 环境干球温度
+
+        Returns:
+            CoolingSystemResults with one float64 array per output field
+            批量结果（每个字段为一个数组）
+        """
+        if t_db_ambient_C is None:
+            q, m_dot_chw, t_chw_return, t_wb = _broadcast_lanes(
+                q_cooling_load_W, m_dot_chw_kg_s, t_chw_return_C, t_wb_ambient_C
+            )
+            t_db = None
+        else:
+            q, m_dot_chw, t_chw_return, t_wb, t_db = _broadcast_lanes(
+                q_cooling_load_W, m_dot_chw_kg_s, t_chw_return_C, t_wb_ambient_C, t_db_ambient_C
+            )
+
+        if np.any(q <= 0):
+            raise ValueError(f"Cooling load must be positive: {q[q <= 0]}")
+        if np.any(m_dot_chw <= 0):
+            raise ValueError(f"CHW flow rate must be positive: {m_dot_chw[m_dot_chw <= 0]}")
+        if np.any(t_chw_return <= self.t_chw_supply):
             raise ValueError(
-                f"Cooling system did not converge after {self.max_iter} iterations. "
-                f"Last ΔT = {abs(t_cw_in_new - t_cw_in):.3f}°C"
+                f"CHW return temp ({t_chw_return[t_chw_return <= self.t_chw_supply]}°C) "
+                f"must be > supply temp ({self.t_chw_supply}°C)"
             )
+        if np.any((t_wb < -20) | (t_wb > 50)):
+            raise ValueError(f"Invalid t_wb: {t_wb[(t_wb < -20) | (t_wb > 50)]}, must be between -20 and 50 C")
 
-        # Step 4: Calculate pump power
-        pump_result = self.pump_system.solve(m_dot_cw=m_dot_cw)
+        # Estimate condenser water flow rate
+        m_dot_cw = q * _Q_COND_OVERESTIMATE / (_CP_WATER_J_PER_KG_K * _DELTA_T_CW_DESIGN_C)
+
+        # Initial guess: the tower model's own outlet estimate (approach above
+        # wet bulb), as in solve()
+        t_cw_in = t_wb + self.cooling_tower.approach
+
+        # Fixed-point iteration (Steps 1-4) on whole arrays. Every pass runs the
+        # chiller and the tower; only lanes whose condenser-water temperature is
+        # still moving are re-solved.
+        n = q.shape[0]
+        active = np.ones(n, dtype=bool)
+        chiller_result = None
+        tower_result = None
+        for iteration in range(self.max_iter):
+            idx = np.flatnonzero(active)
+            lane_chiller = self.chiller.solve_energy_balance_batch(
+                q_evap=q[idx],
+                m_dot_chw=m_dot_chw[idx],
+                m_dot_cw=m_dot_cw[idx],
+                t_cw_in=t_cw_in[idx],
+                t_chw_return=t_chw_return[idx],
+            )
+            lane_tower = self.cooling_tower.solve_batch(
+                q_cond=lane_chiller["Q_cond_W"],
+                m_dot_cw=m_dot_cw[idx],
+                t_in=lane_chiller["T_cw_out_C"],
+                t_wb=t_wb[idx],
+                t_db=None if t_db is None else t_db[idx],
+            )
+            if chiller_result is None:
+                chiller_result = {key: np.empty(n, dtype=value.dtype) for key, value in lane_chiller.items()}
+                tower_result = np.empty(n, dtype=lane_tower.dtype)
+            for key, value in lane_chiller.items():
+                chiller_result[key][idx] = value
+            tower_result[idx] = lane_tower
+
+            t_new = lane_tower["T_water_out_C"]
+            diff = np.abs(t_new - t_cw_in[idx])
+            t_cw_in[idx] = t_new
+            active[idx[diff < self.tol_C]] = False
+            if not active.any():
+                break
+        else:
+            raise ValueError(
+                f"Cooling system did not converge after {self.max_iter} iterations "
+                f"for {np.count_nonzero(active)} of {n} operating points. "
+                f"Last max ΔT = {np.max(diff):.3f}°C"
+            )
 
-        # Step 5: Package results
-        return {
-            "downstream_interface": {
-                "component": "CoolingSystem",
-                "T_chw_supply_C": self.t_chw_supply,
-                "T_chw_return_C": t_chw_return_C,
-                "m_dot_chw_kg_s": m_dot_chw_kg_s,
-                "Q_cooling_W": q_cooling_load_W,
-                "Q_cooling_MW": q_cooling_load_W / 1e6,
-                "deltaT_chw_C": t_chw_return_C - self.t_chw_supply,
-                "system_COP": chiller_result["COP"],
-                "total_power_W": chiller_result["W_comp_MW"] * 1e6 + pump_result["P_pump_W"] + tower_result["W_fan_MW"] * 1e6,
-                "total_power_MW": chiller_result["W_comp_MW"] + pump_result["P_pump_W"] / 1e6 + tower_result["W_fan_MW"],
-            },
+        w_fan = tower_result["W_fan_W"]
+
+        # Pump power, same expression as Pump.calculate_power
+        cw_pump = self.pump_system.cw_pump
+        H_total = cw_pump.calculate_total_head()
+        p_pump = (cw_pump.rho_water * cw_pump.g * H_total * (m_dot_cw / cw_pump.rho_water)) / cw_pump.efficiency
+
+        total_power_W = np.add(chiller_result["W_comp_W"], p_pump)
+        total_power_W += w_fan
+
+        return CoolingSystemResults(
+            T_chw_supply_C=np.full(n, float(self.t_chw_supply)),
+            T_chw_return_C=t_chw_return,
+            m_dot_chw_kg_s=m_dot_chw,
+            Q_cooling_W=q,
+            system_COP=chiller_result["COP"],
+            total_power_W=total_power_W,
+            W_comp_W=chiller_result["W_comp_W"],
+            W_fan_W=w_fan,
+            P_pump_W=p_pump,
+            Q_cond_W=chiller_result["Q_cond_W"],
+            T_evap_sat_C=chiller_result["T_evap_sat_C"],
+            T_cond_sat_C=chiller_result["T_cond_sat_C"],
+            m_dot_cw_kg_s=m_dot_cw,
+            T_cw_from_tower_C=t_cw_in,
+            T_cw_to_tower_C=chiller_result["T_cw_out_C"],
+            m_dot_air_kg_s=tower_result["m_dot_da_kg_s"],
+            m_evap_kg_s=tower_result["m_evap_kg_s"],
+            m_makeup_kg_s=tower_result["m_makeup_kg_s"],
+            energy_balance_error_pct=chiller_result["energy_balance_error_pct"],
+            iterations=iteration + 1,
+        )
 
-            "internal_states": {
-                "convergence": {
-                    "converged": converged,
-                    "iterations": iteration + 1,
-                    "final_temp_diff_C": abs(t_cw_in_new - t_cw_in) if not converged else 0.0,
-                },
-
-                "chiller": {
-                    "Q_evap_MW": chiller_result["Q_evap_MW"],
-                    "Q_cond_MW": chiller_result["Q_cond_MW"],
-                    "W_comp_MW": chiller_result["W_comp_MW"],
-                    "COP": chiller_result["COP"],
-                    "PLR": chiller_result["PLR"],
-                    "T_evap_sat_C": chiller_result["T_evap_sat_C"],
-                    "T_cond_sat_C": chiller_result["T_cond_sat_C"],
-                    "P_evap_kPa": chiller_result["P_evap_kPa"],
-                    "P_cond_kPa": chiller_result["P_cond_kPa"],
-                    "compression_ratio": chiller_result["compression_ratio"],
-                    "m_dot_ref_kg_s": chiller_result["m_dot_ref_kg_s"],
-                    "refrigerant": chiller_result["refrigerant"],
-                },
-
-                "condenser_water_loop": {
-                    "m_dot_cw_kg_s": m_dot_cw,
-                    "T_cw_from_tower_C": t_cw_in,
-                    "T_cw_to_tower_C": chiller_result["T_cw_out_C"],
-                    "deltaT_cw_C": chiller_result["T_cw_out_C"] - t_cw_in,
-                    "Q_rejected_MW": chiller_result["Q_cond_MW"],
-                },
-
-                "cooling_tower": {
-                    "Q_rejected_MW": tower_result["Q_cond_MW"],
-                    "T_water_in_C": tower_result["T_water_in_C"],
-                    "T_water_out_C": tower_result["T_water_out_C"],
-                    "T_wb_ambient_C": t_wb_ambient_C,
-                    "T_db_ambient_C": tower_result["T_db_in_C"],
-                    "approach_C": tower_result["Approach_C"],
-                    "range_C": tower_result["Range_C"],
-                    "m_dot_air_kg_s": tower_result["m_dot_da_kg_s"],
-                    "W_fan_MW": tower_result["W_fan_MW"],
-                    "m_evap_kg_s": tower_result["m_evap_kg_s"],
-                    "m_makeup_kg_s": tower_result["m_makeup_kg_s"],
-                    "m_makeup_L_hr": tower_result["m_makeup_L_hr"],
-                    "COC": tower_result["COC"],
-                    "RH_in_pct": tower_result["RH_in"] * 100,
-                    "RH_out_pct": tower_result["RH_out"] * 100,
-                },
-
-                "pump": {
-                    "P_pump_W": pump_result["P_pump_W"],
-                    "P_pump_kW": pump_result["P_pump_W"] / 1000,
-                    "static_head_m": pump_result.get("static_head_m", 0),
-                    "efficiency": pump_result.get("efficiency", 0),
-                },
-
-                "energy_balance": {
-                    "Q_evap_MW": chiller_result["Q_evap_MW"],
-                    "W_comp_MW": chiller_result["W_comp_MW"],
-                    "Q_cond_MW": chiller_result["Q_cond_MW"],
-                    "error_pct": abs(
-                        chiller_result["Q_cond_MW"] -
-                        (chiller_result["Q_evap_MW"] + chiller_result["W_comp_MW"])
-                    ) / chiller_result["Q_cond_MW"] * 100,
-                },
-            },
+    def solve_sweep(
+        self,
+        q_cooling_load_W,
+        m_dot_chw_kg_s,
+        t_chw_return_C,
+        t_wb_ambient_C,
+        t_db_ambient_C=None,
+        workers=None,
+    ) -> CoolingSystemResults:
+        """
+        Solve many independent scenarios, split across worker processes.
+        多工况并行求解（按进程拆分）
+
+        The operating points are broadcast, cut into one contiguous chunk per
+        worker and each chunk is solved with solve_batch in its own process;
+        the chunks are concatenated back in input order. Falls back to a plain
+        solve_batch call for a single worker, too few points, or when the
+        COOLING_DISABLE_PARALLEL environment variable is set (for debugging).
+
+        Args:
+            Same as solve_batch, plus
+            workers: Number of processes (default: os.cpu_count())
+
+        Returns:
+            CoolingSystemResults over all scenarios; iterations is the largest
+            count needed by any chunk
+        """
+        if t_db_ambient_C is None:
+            lanes = _broadcast_lanes(q_cooling_load_W, m_dot_chw_kg_s, t_chw_return_C, t_wb_ambient_C)
+        else:
+            lanes = _broadcast_lanes(
+                q_cooling_load_W, m_dot_chw_kg_s, t_chw_return_C, t_wb_ambient_C, t_db_ambient_C
+            )
+        n = lanes[0].shape[0]
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, n)
+        if workers <= 1 or os.environ.get("COOLING_DISABLE_PARALLEL"):
+            return self.solve_batch(*lanes)
+
+        chunks = [np.array_split(lane, workers) for lane in lanes]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(self.solve_batch, *chunks))
+
+        merged = {
+            f.name: np.concatenate([getattr(part, f.name) for part in parts])
+            for f in fields(CoolingSystemResults) if f.name != "iterations"
         }
+        return CoolingSystemResults(**merged, iterations=max(part.iterations for part in parts))
 
 
 if __name__ == "__main__":
@@ -36,12 +36,17 @@ from cooling_system import CoolingSystem
 # Building System 建筑系统
 import importlib.util
 import sys
-
-# Load Building module (handle space in filename)
-spec = importlib.util.spec_from_file_location("building_module", "Building and HeatEX.py")
-building_module = importlib.util.module_from_spec(spec)
-sys.modules["building_module"] = building_module
-spec.loader.exec_module(building_module)
+from dataclasses import dataclass
+from functools import lru_cache
+
+# Load Building module (handle space in filename); reuse it if already loaded
+if "building_module" in sys.modules:
+    building_module = sys.modules["building_module"]
+else:
+    spec = importlib.util.spec_from_file_location("building_module", "Building and HeatEX.py")
+    building_module = importlib.util.module_from_spec(spec)
+    sys.modules["building_module"] = building_module
+    spec.loader.exec_module(building_module)
 
 BuildingHeatExchanger = building_module.BuildingHeatExchanger
 AirCooledComponent = building_module.AirCooledComponent
@@ -55,6 +60,12 @@ from CHIPCOOLING import compute_selected_with_branches_and_hx, print_results
 # System Parameters - 系统参数
 # ============================================================================
 
+CP_WATER = 4186.0  # Specific heat of water 水的比热容 J/(kg·K)
+CP_AIR = 1005.0  # Specific heat of air 空气比热容 J/(kg·K)
+CHIP_HX_EFFECTIVENESS = 0.90  # Compute (chip) HX effectiveness 芯片热交换器效能
+
+
+@dataclass(frozen=True, slots=True)
 class SystemParameters:
     """
     Complete system parameters.
@@ -66,50 +77,215 @@ class SystemParameters:
     - 10% from air-cooled equipment: 100 MW
     - Chip cooling water: max 40°C
     - Air cooling: max 25°C
+
+    Instances are immutable and hashable, so a parameter set can key the
+    cached simulation; vary a design with SystemParameters(T_WB_AMBIENT_C=28.0).
+    参数对象不可变（可作为缓存键）
     """
     # ===== Total System Load =====
-    Q_TOTAL_MW = 1000.0  # Total datacenter cooling load 总冷负荷
+    Q_TOTAL_MW: float = 1000.0  # Total datacenter cooling load 总冷负荷
 
     # ===== Chip / GPU Parameters (90% of total) =====
     # Liquid-cooled GPUs: 900 MW
-    N_GPUS = 2250  # Number of GPUs GPU数量 (2250 × 400kW = 900MW)
-    P_GPU_W = 400000.0  # Power per GPU (W) 单个GPU功率 (400 kW each for high-power AI GPUs)
-    Q_CHIP_MW = 900.0  # Total chip cooling load 芯片总冷负荷
+    N_GPUS: int = 2250  # Number of GPUs GPU数量 (2250 × 400kW = 900MW)
+    P_GPU_W: float = 400000.0  # Power per GPU (W) 单个GPU功率 (400 kW each for high-power AI GPUs)
+    Q_CHIP_MW: float = 900.0  # Total chip cooling load 芯片总冷负荷
 
     # Chip cooling loop temperatures 芯片冷却回路温度
-    T_CHIP_IN_C = 30.0  # Chip inlet temp (from HX) 芯片入口温度
-    T_CHIP_OUT_C = 40.0  # Chip outlet temp (to pump) 芯片出口温度 (max limit)
+    T_CHIP_IN_C: float = 30.0  # Chip inlet temp (from HX) 芯片入口温度
+    T_CHIP_OUT_C: float = 40.0  # Chip outlet temp (to pump) 芯片出口温度 (max limit)
 
     # ===== Building Parameters (10% of total) =====
     # Air-cooled equipment: 100 MW
-    Q_BUILDING_MW = 100.0  # Building/Air-cooled load 建筑/风冷负荷
-    Q_BUILDING_W = 100e6  # Same in Watts 瓦特单位
+    Q_BUILDING_MW: float = 100.0  # Building/Air-cooled load 建筑/风冷负荷
 
     # Building heat exchanger 建筑热交换器
-    HX_EFFECTIVENESS = 0.75  # Heat exchanger effectiveness 热交换器效能
-    T_AIR_COOLED_MAX_C = 25.0  # Max air temperature for workers 最高空气温度
-    T_AIR_AMBIENT_C = 22.0  # Ambient indoor air temp 室内环境温度
+    HX_EFFECTIVENESS: float = 0.75  # Heat exchanger effectiveness 热交换器效能
+    T_AIR_COOLED_MAX_C: float = 25.0  # Max air temperature for workers 最高空气温度
+    T_AIR_AMBIENT_C: float = 22.0  # Ambient indoor air temp 室内环境温度
 
     # ===== Cooling System Parameters =====
     # Chiller 冷水机组
-    T_CHW_SUPPLY_C = 7.0  # Chilled water supply temp 冷冻水供水温度
-    DELTA_T_CHW_DESIGN_C = 5.0  # Design delta-T for CHW 冷冻水设计温差
-    CHILLER_COP = 6.0  # Chiller COP 冷水机组能效比
+    T_CHW_SUPPLY_C: float = 7.0  # Chilled water supply temp 冷冻水供水温度
+    DELTA_T_CHW_DESIGN_C: float = 5.0  # Design delta-T for CHW 冷冻水设计温差
+    CHILLER_COP: float = 6.0  # Chiller COP 冷水机组能效比
 
     # Cooling tower 冷却塔
-    TOWER_APPROACH_C = 4.0  # Approach temperature 接近温度
-    TOWER_COC = 4.0  # Cycles of concentration 浓缩倍数
+    TOWER_APPROACH_C: float = 4.0  # Approach temperature 接近温度
+    TOWER_COC: float = 4.0  # Cycles of concentration 浓缩倍数
 
     # ===== Ambient Conditions =====
-    T_WB_AMBIENT_C = 24.0  # Wet bulb temperature 湿球温度
-    T_DB_AMBIENT_C = 35.0  # Dry bulb temperature 干球温度
+    T_WB_AMBIENT_C: float = 24.0  # Wet bulb temperature 湿球温度
+    T_DB_AMBIENT_C: float = 35.0  # Dry bulb temperature 干球温度
+
+    @property
+    def Q_BUILDING_W(self) -> float:
+        """Building load in W, derived from Q_BUILDING_MW. 建筑负荷（瓦特）"""
+        return self.Q_BUILDING_MW * 1e6
+
+
+# ============================================================================
+# Report Templates - 报告模板
+# ============================================================================
+
+# Positional templates for the fixed-layout summary sections, each filled
+# with one str.format call (same text as the per-line f-strings they replace)
+
+CASCADE_FMT = (
+    "\n【水温度级联 Water Temperature Cascade】\n"
+    "  ① Chiller出口 Chiller Outlet:  {:.1f} °C\n"
+    "  ② Building HX出 Building Out:  {:.2f} °C  (温升 +{:.2f}°C)\n"
+    "  ③ Compute HX出 Compute Out:    {:.2f} °C  (温升 +{:.2f}°C)\n"
+    "  ④ 总温升 Total Rise:            {:.2f} °C\n"
+    "  ⑤ 回到Chiller Return to Chill: {:.2f} °C"
+)
+
+ENERGY_FMT = (
+    "\n【能量平衡 Energy Balance】\n"
+    "  建筑HX吸热 Building HX:        {:.1f} MW\n"
+    "  芯片HX吸热 Compute HX:         {:.1f} MW\n"
+    "  总吸热 Total Heat Absorbed:    {:.1f} MW\n"
+    "  设计冷负荷 Design Load:        {:.1f} MW\n"
+    "  能量平衡误差 Balance Error:    {:.2f} MW"
+)
+
+KPI_FMT = (
+    "\n  IT功率 IT Power:               {:.1f} MW\n"
+    "    - 液冷GPU Liquid-cooled:     {:.1f} MW (90%)\n"
+    "    - 风冷设备 Air-cooled:       {:.1f} MW (10%)\n"
+    "\n  冷却功率 Cooling Power:        {:.1f} MW\n"
+    "    - 冷水机组 Chiller:          {:.1f} MW\n"
+    "    - 冷却塔 Cooling Tower:      {:.1f} MW\n"
+    "    - 冷冻水泵 CHW Pumps:        {:.2f} MW\n"
+    "    - 芯片泵 Chip Pumps:         {:.3f} MW\n"
+    "\n  ★ PUE (Power Usage Effectiveness):\n"
+    "    PUE = (IT + Cooling) / IT\n"
+    "        = ({:.1f} + {:.1f}) / {:.1f}\n"
+    "        = {:.3f}\n"
+    "    行业标准 Industry Standard: 1.2-1.5 (good), <1.2 (excellent)\n"
+    "\n  ★ WUE (Water Usage Effectiveness):\n"
+    "    年补水量 Annual Makeup:      {:,.0f} m³/year\n"
+    "    年IT能耗 Annual IT Energy:   {:,.1f} million kWh\n"
+    "    WUE = {:,.0f} m³ × 1000 / {:,.1f}M kWh\n"
+    "        = {:.3f} L/kWh\n"
+    "    行业标准 Industry Standard: <1.8 L/kWh (good), <1.0 L/kWh (excellent)\n"
+    "\n  社会影响 Societal Impact:\n"
+    "    水消耗 Water Consumption:    {:,.0f} m³/year\n"
+    "      等同于 Equivalent to:      {:,.0f} m³/day\n"
+    "      约 Approximately:          {:.1f} million gallons/year\n"
+    "    能耗 Energy Consumption:     {:.1f}% overhead"
+)
+
+
+# ============================================================================
+# Design Point - 设计工况
+# ============================================================================
+
+@dataclass(frozen=True, slots=True)
+class _DesignPoint:
+    """
+    Ambient-independent part of the system: loads, the chilled-water cascade
+    (Building HX → Compute HX) and the cooling system sized for it.
+    与环境无关的设计工况（负荷、冷冻水级联、冷却系统）
+    """
+    Q_total_cooling_W: float
+    m_dot_chw_kg_s: float
+    t_chw_return_design_C: float
+    T_water_after_building_C: float
+    Q_building_actual_W: float
+    chip_result: dict
+    T_water_after_compute_C: float
+    Q_chip_actual_W: float
+    cooling_system: CoolingSystem
+
+
+def _design_point(params: SystemParameters) -> _DesignPoint:
+    """
+    Solve the chilled-water cascade and size the cooling system (Steps 0-3).
+    求解冷冻水级联并确定冷却系统规模
+
+    Shared by run_complete_system and run_complete_system_batch so both use
+    the same design.
+    """
+    # Total cooling load
+    Q_total_cooling_W = params.Q_CHIP_MW * 1e6 + params.Q_BUILDING_W
+
+    # Chilled water flow rate based on total load and design delta-T
+    # Q = m_dot × Cp × ΔT
+    m_dot_chw_kg_s = Q_total_cooling_W / (CP_WATER * params.DELTA_T_CHW_DESIGN_C)
+    t_chw_return_C = params.T_CHW_SUPPLY_C + params.DELTA_T_CHW_DESIGN_C
+
+    # Initialize cooling system (Chiller + Tower + Pump)
+    cooling_system = CoolingSystem(
+        chiller_capacity_MW=Q_total_cooling_W / 1e6,
+        chiller_cop=params.CHILLER_COP,
+        t_chw_supply_C=params.T_CHW_SUPPLY_C,
+        tower_approach_C=params.TOWER_APPROACH_C,
+        tower_coc=params.TOWER_COC,
+    )
+
+    # Building heat exchanger: hot air (25°C) exchanges heat with cold water (7°C)
+    # Direct calculation: 100 MW from air to water
+    T_water_after_building_C = params.T_CHW_SUPPLY_C + params.Q_BUILDING_W / (m_dot_chw_kg_s * CP_WATER)
+    Q_building_actual_W = params.Q_BUILDING_W  # By design: exactly 100 MW
+
+    # Chip cooling system receives water from Building HX outlet
+    # T_bin is now the water temperature after Building HX
+    chip_result = compute_selected_with_branches_and_hx(
+        N=params.N_GPUS,
+        P_gpu=params.P_GPU_W,                # Power per GPU in W
+        m_b=m_dot_chw_kg_s,                  # Building (water) loop flow
+        T_bin=T_water_after_building_C,      # Water inlet from Building HX
+        T1=params.T_CHIP_IN_C,               # Chip loop inlet: 30°C
+        T2=params.T_CHIP_OUT_C,              # Chip loop outlet: 40°C (max)
+        rho=997.0,
+        gpus_per_branch=225,                 # 2250 GPUs / 225 per branch = 10 branches
+        epsilon=CHIP_HX_EFFECTIVENESS,       # Chip HX effectiveness
+        # Larger pipe diameters for lower pressure drop (optimized for 900 MW system)
+        D1=0.20,  # Rack pipe: 200mm
+        D2=1.00,  # Branch pipe: 1000mm (1m)
+        D3=3.00,  # Header pipe: 3000mm (3m)
+    )
+
+    return _DesignPoint(
+        Q_total_cooling_W=Q_total_cooling_W,
+        m_dot_chw_kg_s=m_dot_chw_kg_s,
+        t_chw_return_design_C=t_chw_return_C,
+        T_water_after_building_C=T_water_after_building_C,
+        Q_building_actual_W=Q_building_actual_W,
+        chip_result=chip_result,
+        T_water_after_compute_C=chip_result['T_to_tower_C'],
+        Q_chip_actual_W=chip_result['Q_through_HX_W'],
+        cooling_system=cooling_system,
+    )
+
+
+def _kpis(params: SystemParameters, cooling_power_W, chip_pump_W, makeup_kg_s):
+    """
+    Overall system metrics; cooling power and makeup may be scalars or arrays.
+    系统总体指标（PUE/WUE）
+
+    Returns:
+        (total_IT_power_MW, total_cooling_power_MW, pue, annual_water_m3,
+        annual_it_kwh, wue)
+    """
+    total_IT_power_MW = params.Q_TOTAL_MW  # 1000 MW total IT load
+    total_cooling_power_MW = cooling_power_W / 1e6 + chip_pump_W / 1e6
+    pue = (total_IT_power_MW + total_cooling_power_MW) / total_IT_power_MW
+
+    # Water usage
+    annual_water_m3 = makeup_kg_s * 3600 * 8760 / 1000  # kg/s → m³/year
+    annual_it_kwh = total_IT_power_MW * 1000 * 8760  # MW → kWh/year
+    wue = annual_water_m3 * 1000 / annual_it_kwh  # L/kWh
+    return total_IT_power_MW, total_cooling_power_MW, pue, annual_water_m3, annual_it_kwh, wue
 
 
 # ============================================================================
 # Main System Simulation - 主系统仿真
 # ============================================================================
 
-def run_complete_system():
+@lru_cache(maxsize=64)
+def _simulate(params: SystemParameters):
     """
     Run complete integrated system simulation following the project architecture:
 
@@ -129,174 +305,147 @@ def run_complete_system():
     冷却塔为冷水机组的冷凝器服务，不直接与冷冻水循环交互。
 
     运行完整的集成系统仿真，按照项目架构流程
-    """
-    print("\n" + "=" * 100)
-    print("1 GW AI数据中心冷却系统仿真 - 1 GW AI DATACENTER COOLING SYSTEM SIMULATION")
-    print("Project: Modern Datacenter Building Cooling System Design")
-    print("CHW Loop: Chiller Evap → Building HX → Compute HX → Chiller Evap")
-    print("CW Loop:  Chiller Cond → Cooling Tower → Chiller Cond")
-    print("=" * 100)
-
-    params = SystemParameters()
 
-    print(f"\n【系统设计参数 System Design Parameters】")
-    print(f"  总IT负荷 Total IT Load:        {params.Q_TOTAL_MW:.0f} MW")
-    print(f"  液冷芯片 Liquid-cooled GPUs:   {params.Q_CHIP_MW:.0f} MW (90%)")
-    print(f"  风冷设备 Air-cooled Equipment: {params.Q_BUILDING_MW:.0f} MW (10%)")
-    print(f"  GPU数量 Number of GPUs:        {params.N_GPUS:,} × {params.P_GPU_W/1000:.0f}kW")
+    Returns (report_text, results); cached per parameter set, see
+    run_complete_system.
+    """
+    # The report is collected here and written in one go at the end
+    lines = []
+    lines.append("\n" + "=" * 100)
+    lines.append("1 GW AI数据中心冷却系统仿真 - 1 GW AI DATACENTER COOLING SYSTEM SIMULATION")
+    lines.append("Project: Modern Datacenter Building Cooling System Design")
+    lines.append("CHW Loop: Chiller Evap → Building HX → Compute HX → Chiller Evap")
+    lines.append("CW Loop:  Chiller Cond → Cooling Tower → Chiller Cond")
+    lines.append("=" * 100)
+
+    lines.append(f"\n【系统设计参数 System Design Parameters】")
+    lines.append(f"  总IT负荷 Total IT Load:        {params.Q_TOTAL_MW:.0f} MW")
+    lines.append(f"  液冷芯片 Liquid-cooled GPUs:   {params.Q_CHIP_MW:.0f} MW (90%)")
+    lines.append(f"  风冷设备 Air-cooled Equipment: {params.Q_BUILDING_MW:.0f} MW (10%)")
+    lines.append(f"  GPU数量 Number of GPUs:        {params.N_GPUS:,} × {params.P_GPU_W/1000:.0f}kW")
 
     # ========================================================================
-    # STEP 0: Calculate system-wide parameters
+    # STEP 0: Calculate system-wide parameters (Steps 0-3 solved in _design_point)
     # ========================================================================
-
-    # Total cooling load
-    Q_total_cooling_W = params.Q_CHIP_MW * 1e6 + params.Q_BUILDING_W
-
-    # Chilled water flow rate based on total load and design delta-T
-    # Q = m_dot × Cp × ΔT
-    Cp_water = 4186.0  # J/(kg·K)
-    m_dot_chw_kg_s = Q_total_cooling_W / (Cp_water * params.DELTA_T_CHW_DESIGN_C)
-    t_chw_return_C = params.T_CHW_SUPPLY_C + params.DELTA_T_CHW_DESIGN_C
-
-    print(f"\n【冷冻水系统参数 Chilled Water System】")
-    print(f"  总冷负荷 Total Cooling Load:   {Q_total_cooling_W/1e6:.1f} MW")
-    print(f"  流量 Flow Rate:                {m_dot_chw_kg_s:.0f} kg/s")
-    print(f"  供水温度 Supply Temp:          {params.T_CHW_SUPPLY_C:.1f} °C")
-    print(f"  回水温度 Return Temp:          {t_chw_return_C:.1f} °C")
-    print(f"  温差 Delta-T:                  {params.DELTA_T_CHW_DESIGN_C:.1f} °C")
+    design = _design_point(params)
+    Q_total_cooling_W = design.Q_total_cooling_W
+    m_dot_chw_kg_s = design.m_dot_chw_kg_s
+    t_chw_return_C = design.t_chw_return_design_C
+
+    lines.append(f"\n【冷冻水系统参数 Chilled Water System】")
+    lines.append(f"  总冷负荷 Total Cooling Load:   {Q_total_cooling_W/1e6:.1f} MW")
+    lines.append(f"  流量 Flow Rate:                {m_dot_chw_kg_s:.0f} kg/s")
+    lines.append(f"  供水温度 Supply Temp:          {params.T_CHW_SUPPLY_C:.1f} °C")
+    lines.append(f"  回水温度 Return Temp:          {t_chw_return_C:.1f} °C")
+    lines.append(f"  温差 Delta-T:                  {params.DELTA_T_CHW_DESIGN_C:.1f} °C")
 
     # ========================================================================
     # STEP 1: Chiller - 冷水机组
     # ========================================================================
-    print("\n" + "-" * 100)
-    print("步骤 1: 冷水机组 - STEP 1: CHILLER (produces chilled water at 7°C)")
-    print("-" * 100)
+    lines.append("\n" + "-" * 100)
+    lines.append("步骤 1: 冷水机组 - STEP 1: CHILLER (produces chilled water at 7°C)")
+    lines.append("-" * 100)
 
-    # Initialize cooling system (Chiller + Tower + Pump)
-    cooling_system = CoolingSystem(
-        chiller_capacity_MW=Q_total_cooling_W / 1e6,
-        chiller_cop=params.CHILLER_COP,
-        t_chw_supply_C=params.T_CHW_SUPPLY_C,
-        tower_approach_C=params.TOWER_APPROACH_C,
-        tower_coc=params.TOWER_COC,
-    )
+    cooling_system = design.cooling_system
 
-    print(f"  冷水机容量 Chiller Capacity:   {Q_total_cooling_W/1e6:.1f} MW")
-    print(f"  设计COP Design COP:            {params.CHILLER_COP:.1f}")
+    lines.append(f"  冷水机容量 Chiller Capacity:   {Q_total_cooling_W/1e6:.1f} MW")
+    lines.append(f"  设计COP Design COP:            {params.CHILLER_COP:.1f}")
 
     # ========================================================================
     # STEP 2: Building Heat Exchanger - 建筑热交换器 (Air-Cooled Equipment)
     # ========================================================================
-    print("\n" + "-" * 100)
-    print("步骤 2: 建筑热交换器 - STEP 2: BUILDING HXer (Air-Cooled Equipment)")
-    print("Water receives heat from air-cooled servers (100 MW)")
-    print("-" * 100)
+    lines.append("\n" + "-" * 100)
+    lines.append("步骤 2: 建筑热交换器 - STEP 2: BUILDING HXer (Air-Cooled Equipment)")
+    lines.append("Water receives heat from air-cooled servers (100 MW)")
+    lines.append("-" * 100)
 
     # Building air-side parameters
     # Air-cooled equipment generates 100 MW of heat
     # Air circulates: absorbs heat from equipment → goes to HX → cools down → returns
-    Cp_air = 1005.0  # J/(kg·K)
     T_air_cold_C = params.T_AIR_AMBIENT_C  # 22°C (air leaving HX, entering building)
     T_air_hot_C = params.T_AIR_COOLED_MAX_C  # 25°C (air leaving equipment, entering HX)
 
     # Air flow needed to absorb 100 MW with 3°C rise
     deltaT_air_C = T_air_hot_C - T_air_cold_C  # 3°C
-    m_dot_air_kg_s = params.Q_BUILDING_W / (Cp_air * deltaT_air_C)
+    m_dot_air_kg_s = params.Q_BUILDING_W / (CP_AIR * deltaT_air_C)
 
-    # Building heat exchanger: hot air (25°C) exchanges heat with cold water (7°C)
-    # Direct calculation: 100 MW from air to water
-    T_water_after_building_C = params.T_CHW_SUPPLY_C + params.Q_BUILDING_W / (m_dot_chw_kg_s * Cp_water)
-    Q_building_actual_W = params.Q_BUILDING_W  # By design: exactly 100 MW
+    # Building heat exchanger water side (see _design_point)
+    T_water_after_building_C = design.T_water_after_building_C
+    Q_building_actual_W = design.Q_building_actual_W
 
     # Air outlet temperature from HX (cooled down)
-    T_air_out_HX_C = T_air_hot_C - params.Q_BUILDING_W / (m_dot_air_kg_s * Cp_air)
+    T_air_out_HX_C = T_air_hot_C - params.Q_BUILDING_W / (m_dot_air_kg_s * CP_AIR)
 
-    print(f"\n  建筑侧（空气）Building Side (Air):")
-    print(f"    流量 Flow Rate:              {m_dot_air_kg_s:.1f} kg/s")
-    print(f"    设备出口 Equipment Outlet:   {T_air_hot_C:.1f} °C (hot air from equipment)")
-    print(f"    HX出口 HX Outlet:            {T_air_out_HX_C:.1f} °C (cooled air)")
-    print(f"    温差 Delta-T:                {T_air_hot_C - T_air_out_HX_C:.1f} °C")
+    lines.append(f"\n  建筑侧（空气）Building Side (Air):")
+    lines.append(f"    流量 Flow Rate:              {m_dot_air_kg_s:.1f} kg/s")
+    lines.append(f"    设备出口 Equipment Outlet:   {T_air_hot_C:.1f} °C (hot air from equipment)")
+    lines.append(f"    HX出口 HX Outlet:            {T_air_out_HX_C:.1f} °C (cooled air)")
+    lines.append(f"    温差 Delta-T:                {T_air_hot_C - T_air_out_HX_C:.1f} °C")
 
-    print(f"\n  水侧 Water Side:")
-    print(f"    流量 Flow Rate:              {m_dot_chw_kg_s:.0f} kg/s")
-    print(f"    入口温度 Inlet Temp:         {params.T_CHW_SUPPLY_C:.1f} °C (from chiller)")
-    print(f"    出口温度 Outlet Temp:        {T_water_after_building_C:.2f} °C")
-    print(f"    温升 Temp Rise:              {T_water_after_building_C - params.T_CHW_SUPPLY_C:.2f} °C")
+    lines.append(f"\n  水侧 Water Side:")
+    lines.append(f"    流量 Flow Rate:              {m_dot_chw_kg_s:.0f} kg/s")
+    lines.append(f"    入口温度 Inlet Temp:         {params.T_CHW_SUPPLY_C:.1f} °C (from chiller)")
+    lines.append(f"    出口温度 Outlet Temp:        {T_water_after_building_C:.2f} °C")
+    lines.append(f"    温升 Temp Rise:              {T_water_after_building_C - params.T_CHW_SUPPLY_C:.2f} °C")
 
-    print(f"\n  热交换 Heat Transfer:")
-    print(f"    传热量 Heat Transfer:        {Q_building_actual_W/1e6:.1f} MW")
-    print(f"    设计负荷 Design Load:        {params.Q_BUILDING_MW:.1f} MW")
+    lines.append(f"\n  热交换 Heat Transfer:")
+    lines.append(f"    传热量 Heat Transfer:        {Q_building_actual_W/1e6:.1f} MW")
+    lines.append(f"    设计负荷 Design Load:        {params.Q_BUILDING_MW:.1f} MW")
 
     # ========================================================================
     # STEP 3: Compute Heat Exchanger - 计算热交换器 (Liquid-Cooled Chips)
     # ========================================================================
-    print("\n" + "-" * 100)
-    print("步骤 3: 计算热交换器 - STEP 3: COMPUTE HXer (Liquid-Cooled GPU Chips)")
-    print("Water receives heat from chip cooling loop (900 MW)")
-    print("-" * 100)
-
-    # Chip cooling system receives water from Building HX outlet
-    # T_bin is now the water temperature after Building HX
-    chip_result = compute_selected_with_branches_and_hx(
-        N=params.N_GPUS,
-        P_gpu=params.P_GPU_W,                # Power per GPU in W
-        m_b=m_dot_chw_kg_s,                  # Building (water) loop flow
-        T_bin=T_water_after_building_C,      # Water inlet from Building HX
-        T1=params.T_CHIP_IN_C,               # Chip loop inlet: 30°C
-        T2=params.T_CHIP_OUT_C,              # Chip loop outlet: 40°C (max)
-        rho=997.0,
-        gpus_per_branch=225,                 # 2250 GPUs / 225 per branch = 10 branches
-        epsilon=0.90,                         # Chip HX effectiveness
-        # Larger pipe diameters for lower pressure drop (optimized for 900 MW system)
-        D1=0.20,  # Rack pipe: 200mm
-        D2=1.00,  # Branch pipe: 1000mm (1m)
-        D3=3.00,  # Header pipe: 3000mm (3m)
-    )
-
-    T_water_after_compute_C = chip_result['T_to_tower_C']
-    Q_chip_actual_W = chip_result['Q_through_HX_W']
-
-    print(f"\n  芯片侧（液冷回路）Chip Side (Liquid Loop):")
-    print(f"    GPU数量 Number of GPUs:      {params.N_GPUS:,}")
-    print(f"    芯片总功率 Total Power:      {chip_result['Q_chip_W']/1e6:.1f} MW")
-    print(f"    芯片流量 Flow Rate:          {chip_result['m_chip_kg_s']:.0f} kg/s")
-    print(f"    入口温度 Inlet Temp:         {params.T_CHIP_IN_C:.1f} °C")
-    print(f"    出口温度 Outlet Temp:        {params.T_CHIP_OUT_C:.1f} °C (max limit)")
-    print(f"    泵功率 Pump Power:           {chip_result['W_pump_W']/1e6:.3f} MW")
-
-    print(f"\n  水侧（建筑回路）Water Side (Building Loop):")
-    print(f"    流量 Flow Rate:              {m_dot_chw_kg_s:.0f} kg/s")
-    print(f"    入口温度 Inlet Temp:         {T_water_after_building_C:.2f} °C (from Building HX)")
-    print(f"    出口温度 Outlet Temp:        {T_water_after_compute_C:.2f} °C")
-    print(f"    温升 Temp Rise:              {T_water_after_compute_C - T_water_after_building_C:.2f} °C")
-
-    print(f"\n  热交换 Heat Transfer:")
-    print(f"    通过HX的热量 Heat via HX:    {Q_chip_actual_W/1e6:.1f} MW")
-    print(f"    设计负荷 Design Load:        {params.Q_CHIP_MW:.1f} MW")
-    print(f"    HX效率 HX Effectiveness:     {0.90:.0%}")
+    lines.append("\n" + "-" * 100)
+    lines.append("步骤 3: 计算热交换器 - STEP 3: COMPUTE HXer (Liquid-Cooled GPU Chips)")
+    lines.append("Water receives heat from chip cooling loop (900 MW)")
+    lines.append("-" * 100)
+
+    # Chip cooling loop fed from the Building HX outlet (see _design_point)
+    chip_result = design.chip_result
+    T_water_after_compute_C = design.T_water_after_compute_C
+    Q_chip_actual_W = design.Q_chip_actual_W
+
+    lines.append(f"\n  芯片侧（液冷回路）Chip Side (Liquid Loop):")
+    lines.append(f"    GPU数量 Number of GPUs:      {params.N_GPUS:,}")
+    lines.append(f"    芯片总功率 Total Power:      {chip_result['Q_chip_W']/1e6:.1f} MW")
+    lines.append(f"    芯片流量 Flow Rate:          {chip_result['m_chip_kg_s']:.0f} kg/s")
+    lines.append(f"    入口温度 Inlet Temp:         {params.T_CHIP_IN_C:.1f} °C")
+    lines.append(f"    出口温度 Outlet Temp:        {params.T_CHIP_OUT_C:.1f} °C (max limit)")
+    lines.append(f"    泵功率 Pump Power:           {chip_result['W_pump_W']/1e6:.3f} MW")
+
+    lines.append(f"\n  水侧（建筑回路）Water Side (Building Loop):")
+    lines.append(f"    流量 Flow Rate:              {m_dot_chw_kg_s:.0f} kg/s")
+    lines.append(f"    入口温度 Inlet Temp:         {T_water_after_building_C:.2f} °C (from Building HX)")
+    lines.append(f"    出口温度 Outlet Temp:        {T_water_after_compute_C:.2f} °C")
+    lines.append(f"    温升 Temp Rise:              {T_water_after_compute_C - T_water_after_building_C:.2f} °C")
+
+    lines.append(f"\n  热交换 Heat Transfer:")
+    lines.append(f"    通过HX的热量 Heat via HX:    {Q_chip_actual_W/1e6:.1f} MW")
+    lines.append(f"    设计负荷 Design Load:        {params.Q_CHIP_MW:.1f} MW")
+    lines.append(f"    HX效率 HX Effectiveness:     {CHIP_HX_EFFECTIVENESS:.0%}")
 
     # ========================================================================
     # STEP 4: Complete Cooling System Solve - 完整冷却系统求解
     # ========================================================================
-    print("\n" + "-" * 100)
-    print("步骤 4: 完整冷却系统 - STEP 4: COMPLETE COOLING SYSTEM")
-    print("Solve Chiller (evaporator + condenser) + Cooling Tower system")
-    print("-" * 100)
+    lines.append("\n" + "-" * 100)
+    lines.append("步骤 4: 完整冷却系统 - STEP 4: COMPLETE COOLING SYSTEM")
+    lines.append("Solve Chiller (evaporator + condenser) + Cooling Tower system")
+    lines.append("-" * 100)
 
     # Actual return temperature from the complete cascade
     t_chw_return_actual_C = T_water_after_compute_C
 
-    print(f"\n  冷冻水循环 Chilled Water Loop:")
-    print(f"    供水温度 Supply Temp:        {params.T_CHW_SUPPLY_C:.1f} °C (from evaporator)")
-    print(f"    回水温度 Return Temp:        {t_chw_return_actual_C:.2f} °C (to evaporator)")
-    print(f"    温升 Total Rise:             {t_chw_return_actual_C - params.T_CHW_SUPPLY_C:.2f} °C")
+    lines.append(f"\n  冷冻水循环 Chilled Water Loop:")
+    lines.append(f"    供水温度 Supply Temp:        {params.T_CHW_SUPPLY_C:.1f} °C (from evaporator)")
+    lines.append(f"    回水温度 Return Temp:        {t_chw_return_actual_C:.2f} °C (to evaporator)")
+    lines.append(f"    温升 Total Rise:             {t_chw_return_actual_C - params.T_CHW_SUPPLY_C:.2f} °C")
 
     # Solve complete cooling system
     # This includes:
     # - Chiller evaporator (produces 7°C CHW)
     # - Chiller condenser (rejects heat to condenser water)
     # - Cooling tower (cools condenser water via evaporation)
-    print(f"\n  求解完整系统 Solving Complete System (Chiller + Cooling Tower)...")
+    lines.append(f"\n  求解完整系统 Solving Complete System (Chiller + Cooling Tower)...")
     cooling_result = cooling_system.solve(
         q_cooling_load_W=Q_total_cooling_W,
         m_dot_chw_kg_s=m_dot_chw_kg_s,
@@ -308,9 +457,9 @@ def run_complete_system():
     # ========================================================================
     # STEP 5: Results Summary - 结果汇总
     # ========================================================================
-    print("\n" + "=" * 100)
-    print("系统结果汇总 - SYSTEM RESULTS SUMMARY")
-    print("=" * 100)
+    lines.append("\n" + "=" * 100)
+    lines.append("系统结果汇总 - SYSTEM RESULTS SUMMARY")
+    lines.append("=" * 100)
 
     # Extract results
     ds = cooling_result["downstream_interface"]
@@ -318,110 +467,180 @@ def run_complete_system():
     ch = internal["chiller"]
     ct = internal["cooling_tower"]
 
-    print(f"\n【水温度级联 Water Temperature Cascade】")
-    print(f"  ① Chiller出口 Chiller Outlet:  {params.T_CHW_SUPPLY_C:.1f} °C")
-    print(f"  ② Building HX出 Building Out:  {T_water_after_building_C:.2f} °C  (温升 +{T_water_after_building_C - params.T_CHW_SUPPLY_C:.2f}°C)")
-    print(f"  ③ Compute HX出 Compute Out:    {T_water_after_compute_C:.2f} °C  (温升 +{T_water_after_compute_C - T_water_after_building_C:.2f}°C)")
-    print(f"  ④ 总温升 Total Rise:            {T_water_after_compute_C - params.T_CHW_SUPPLY_C:.2f} °C")
-    print(f"  ⑤ 回到Chiller Return to Chill: {T_water_after_compute_C:.2f} °C")
+    lines.append(CASCADE_FMT.format(
+        params.T_CHW_SUPPLY_C,
+        T_water_after_building_C, T_water_after_building_C - params.T_CHW_SUPPLY_C,
+        T_water_after_compute_C, T_water_after_compute_C - T_water_after_building_C,
+        T_water_after_compute_C - params.T_CHW_SUPPLY_C,
+        T_water_after_compute_C,
+    ))
 
-    print(f"\n【能量平衡 Energy Balance】")
     total_heat_absorbed_MW = (Q_building_actual_W + Q_chip_actual_W) / 1e6
-    print(f"  建筑HX吸热 Building HX:        {Q_building_actual_W/1e6:.1f} MW")
-    print(f"  芯片HX吸热 Compute HX:         {Q_chip_actual_W/1e6:.1f} MW")
-    print(f"  总吸热 Total Heat Absorbed:    {total_heat_absorbed_MW:.1f} MW")
-    print(f"  设计冷负荷 Design Load:        {Q_total_cooling_W/1e6:.1f} MW")
-    print(f"  能量平衡误差 Balance Error:    {abs(total_heat_absorbed_MW - Q_total_cooling_W/1e6):.2f} MW")
-
-    print(f"\n【冷却系统性能 Cooling System Performance】")
-    print(f"  冷量 Cooling Capacity:         {ds['Q_cooling_MW']:.1f} MW")
-    print(f"  系统COP System COP:            {ds['system_COP']:.2f}")
-    print(f"  冷却系统总功率 Total Power:    {ds['total_power_MW']:.1f} MW")
-
-    print(f"\n【冷水机组 Chiller】")
-    print(f"  蒸发器冷量 Q_evap:             {ch['Q_evap_MW']:.1f} MW")
-    print(f"  压缩机功率 W_comp:             {ch['W_comp_MW']:.1f} MW")
-    print(f"  冷凝器热量 Q_cond:             {ch['Q_cond_MW']:.1f} MW")
-    print(f"  COP:                           {ch['COP']:.2f}")
-    print(f"  制冷剂 Refrigerant:            {ch['refrigerant']}")
-
-    print(f"\n【冷却塔 Cooling Tower】")
-    print(f"  热量排放 Heat Rejected:        {ct['Q_rejected_MW']:.1f} MW")
-    print(f"  风机功率 Fan Power:            {ct['W_fan_MW']:.1f} MW")
-    print(f"  蒸发损失 Evaporation Loss:     {ct['m_evap_kg_s']:.2f} kg/s")
-    print(f"  补水量 Water Makeup:           {ct['m_makeup_L_hr']:,.0f} L/hr  ({ct['m_makeup_kg_s']:.2f} kg/s)")
-    print(f"  浓缩倍数 COC:                  {ct['COC']:.1f}")
-
-    print(f"\n【建筑冷却 Building Cooling (Air-Cooled Equipment)】")
-    print(f"  冷负荷 Cooling Load:           {Q_building_actual_W/1e6:.1f} MW")
-    print(f"  空气流量 Air Flow:             {m_dot_air_kg_s:.1f} kg/s")
-    print(f"  空气温度 Air Temp:             {T_air_cold_C:.1f} → {T_air_hot_C:.1f} °C (equipment heating)")
-
-    print(f"\n【芯片冷却 Chip Cooling (Liquid-Cooled GPUs)】")
-    print(f"  GPU数量 Number of GPUs:        {params.N_GPUS:,}")
-    print(f"  芯片总功率 Total Power:        {chip_result['Q_chip_W']/1e6:.1f} MW")
-    print(f"  芯片泵功率 Pump Power:         {chip_result['W_pump_W']/1e6:.3f} MW")
-    print(f"  芯片流量 Chip Flow:            {chip_result['m_chip_kg_s']:.0f} kg/s")
-    print(f"  芯片温度 Chip Temp:            {params.T_CHIP_IN_C:.1f} → {params.T_CHIP_OUT_C:.1f} °C")
+    lines.append(ENERGY_FMT.format(
+        Q_building_actual_W/1e6,
+        Q_chip_actual_W/1e6,
+        total_heat_absorbed_MW,
+        Q_total_cooling_W/1e6,
+        abs(total_heat_absorbed_MW - Q_total_cooling_W/1e6),
+    ))
+
+    lines.append(f"\n【冷却系统性能 Cooling System Performance】")
+    lines.append(f"  冷量 Cooling Capacity:         {ds['Q_cooling_MW']:.1f} MW")
+    lines.append(f"  系统COP System COP:            {ds['system_COP']:.2f}")
+    lines.append(f"  冷却系统总功率 Total Power:    {ds['total_power_MW']:.1f} MW")
+
+    lines.append(f"\n【冷水机组 Chiller】")
+    lines.append(f"  蒸发器冷量 Q_evap:             {ch['Q_evap_MW']:.1f} MW")
+    lines.append(f"  压缩机功率 W_comp:             {ch['W_comp_MW']:.1f} MW")
+    lines.append(f"  冷凝器热量 Q_cond:             {ch['Q_cond_MW']:.1f} MW")
+    lines.append(f"  COP:                           {ch['COP']:.2f}")
+    lines.append(f"  制冷剂 Refrigerant:            {ch['refrigerant']}")
+
+    lines.append(f"\n【冷却塔 Cooling Tower】")
+    lines.append(f"  热量排放 Heat Rejected:        {ct['Q_rejected_MW']:.1f} MW")
+    lines.append(f"  风机功率 Fan Power:            {ct['W_fan_MW']:.1f} MW")
+    lines.append(f"  蒸发损失 Evaporation Loss:     {ct['m_evap_kg_s']:.2f} kg/s")
+    lines.append(f"  补水量 Water Makeup:           {ct['m_makeup_L_hr']:,.0f} L/hr  ({ct['m_makeup_kg_s']:.2f} kg/s)")
+    lines.append(f"  浓缩倍数 COC:                  {ct['COC']:.1f}")
+
+    lines.append(f"\n【建筑冷却 Building Cooling (Air-Cooled Equipment)】")
+    lines.append(f"  冷负荷 Cooling Load:           {Q_building_actual_W/1e6:.1f} MW")
+    lines.append(f"  空气流量 Air Flow:             {m_dot_air_kg_s:.1f} kg/s")
+    lines.append(f"  空气温度 Air Temp:             {T_air_cold_C:.1f} → {T_air_hot_C:.1f} °C (equipment heating)")
+
+    lines.append(f"\n【芯片冷却 Chip Cooling (Liquid-Cooled GPUs)】")
+    lines.append(f"  GPU数量 Number of GPUs:        {params.N_GPUS:,}")
+    lines.append(f"  芯片总功率 Total Power:        {chip_result['Q_chip_W']/1e6:.1f} MW")
+    lines.append(f"  芯片泵功率 Pump Power:         {chip_result['W_pump_W']/1e6:.3f} MW")
+    lines.append(f"  芯片流量 Chip Flow:            {chip_result['m_chip_kg_s']:.0f} kg/s")
+    lines.append(f"  芯片温度 Chip Temp:            {params.T_CHIP_IN_C:.1f} → {params.T_CHIP_OUT_C:.1f} °C")
 
     # Overall System Metrics
-    total_IT_power_MW = params.Q_TOTAL_MW  # 1000 MW total IT load
-    total_cooling_power_MW = ds['total_power_MW'] + chip_result['W_pump_W']/1e6
-    pue = (total_IT_power_MW + total_cooling_power_MW) / total_IT_power_MW
+    (total_IT_power_MW, total_cooling_power_MW, pue,
+     annual_water_m3, annual_it_kwh, wue) = _kpis(
+        params, ds['total_power_W'], chip_result['W_pump_W'], ct['m_makeup_kg_s'],
+    )
 
-    print(f"\n" + "=" * 100)
-    print("【关键性能指标 KEY PERFORMANCE INDICATORS】")
-    print("=" * 100)
+    lines.append(f"\n" + "=" * 100)
+    lines.append("【关键性能指标 KEY PERFORMANCE INDICATORS】")
+    lines.append("=" * 100)
+
+    lines.append(KPI_FMT.format(
+        total_IT_power_MW, params.Q_CHIP_MW, params.Q_BUILDING_MW,
+        total_cooling_power_MW, ch['W_comp_MW'], ct['W_fan_MW'],
+        internal['pump']['P_pump_W']/1e6, chip_result['W_pump_W']/1e6,
+        total_IT_power_MW, total_cooling_power_MW, total_IT_power_MW, pue,
+        annual_water_m3, annual_it_kwh/1e6, annual_water_m3, annual_it_kwh/1e6, wue,
+        annual_water_m3, annual_water_m3/365, annual_water_m3*264.172/1e6,
+        total_cooling_power_MW/total_IT_power_MW*100,
+    ))
+
+    lines.append("\n" + "=" * 100)
+    lines.append("仿真完成 - SIMULATION COMPLETE")
+    lines.append("=" * 100 + "\n")
+
+    return "\n".join(lines) + "\n", {
+        "cooling_system": cooling_result,
+        "chip_cooling": chip_result,
+        "building_cooling": {
+            "Q_absorbed_W": Q_building_actual_W,
+            "T_water_out_C": T_water_after_building_C,
+        },
+        "water_cascade": {
+            "T_chiller_out_C": params.T_CHW_SUPPLY_C,
+            "T_after_building_C": T_water_after_building_C,
+            "T_after_compute_C": T_water_after_compute_C,
+        },
+        "pue": pue,
+        "wue": wue,
+        "total_it_power_MW": total_IT_power_MW,
+        "total_cooling_power_MW": total_cooling_power_MW,
+        "annual_water_m3": annual_water_m3,
+    }
 
-    print(f"\n  IT功率 IT Power:               {total_IT_power_MW:.1f} MW")
-    print(f"    - 液冷GPU Liquid-cooled:     {params.Q_CHIP_MW:.1f} MW (90%)")
-    print(f"    - 风冷设备 Air-cooled:       {params.Q_BUILDING_MW:.1f} MW (10%)")
 
-    print(f"\n  冷却功率 Cooling Power:        {total_cooling_power_MW:.1f} MW")
-    print(f"    - 冷水机组 Chiller:          {ch['W_comp_MW']:.1f} MW")
-    print(f"    - 冷却塔 Cooling Tower:      {ct['W_fan_MW']:.1f} MW")
-    print(f"    - 冷冻水泵 CHW Pumps:        {internal['pump']['P_pump_W']/1e6:.2f} MW")
-    print(f"    - 芯片泵 Chip Pumps:         {chip_result['W_pump_W']/1e6:.3f} MW")
+def run_complete_system(params=None):
+    """
+    Run the complete system simulation, print the report and return the results.
+    运行完整系统仿真，打印报告并返回结果
 
-    print(f"\n  ★ PUE (Power Usage Effectiveness):")
-    print(f"    PUE = (IT + Cooling) / IT")
-    print(f"        = ({total_IT_power_MW:.1f} + {total_cooling_power_MW:.1f}) / {total_IT_power_MW:.1f}")
-    print(f"        = {pue:.3f}")
-    print(f"    行业标准 Industry Standard: 1.2-1.5 (good), <1.2 (excellent)")
+    The simulation is memoized on the (frozen) SystemParameters, so repeated
+    calls with an equal parameter set, e.g. corners revisited by nested sweeps,
+    only re-print the report. Each call returns its own copy of the nested
+    result dicts, so callers may modify it without affecting the cache.
 
-    # Water usage
-    annual_water_m3 = ct['m_makeup_kg_s'] * 3600 * 8760 / 1000  # kg/s → m³/year
-    annual_it_kwh = total_IT_power_MW * 1000 * 8760  # MW → kWh/year
-    wue = annual_water_m3 * 1000 / annual_it_kwh  # L/kWh
+    Args:
+        params: SystemParameters (default: SystemParameters())
 
-    print(f"\n  ★ WUE (Water Usage Effectiveness):")
-    print(f"    年补水量 Annual Makeup:      {annual_water_m3:,.0f} m³/year")
-    print(f"    年IT能耗 Annual IT Energy:   {annual_it_kwh/1e6:,.1f} million kWh")
-    print(f"    WUE = {annual_water_m3:,.0f} m³ × 1000 / {annual_it_kwh/1e6:,.1f}M kWh")
-    print(f"        = {wue:.3f} L/kWh")
-    print(f"    行业标准 Industry Standard: <1.8 L/kWh (good), <1.0 L/kWh (excellent)")
+    Returns:
+        dict with cooling_system, chip_cooling, building_cooling, water_cascade,
+        pue, wue, total_it_power_MW, total_cooling_power_MW, annual_water_m3
+    """
+    if params is None:
+        params = SystemParameters()
+    report, results = _simulate(params)
+    sys.stdout.write(report)
+    return _copy_results(results)
 
-    print(f"\n  社会影响 Societal Impact:")
-    print(f"    水消耗 Water Consumption:    {annual_water_m3:,.0f} m³/year")
-    print(f"      等同于 Equivalent to:      {annual_water_m3/365:,.0f} m³/day")
-    print(f"      约 Approximately:          {annual_water_m3*264.172/1e6:.1f} million gallons/year")
-    print(f"    能耗 Energy Consumption:     {total_cooling_power_MW/total_IT_power_MW*100:.1f}% overhead")
 
-    print("\n" + "=" * 100)
-    print("仿真完成 - SIMULATION COMPLETE")
-    print("=" * 100 + "\n")
+def _copy_results(value):
+    """Copy the nested result dicts; leaf values are immutable. 复制嵌套结果字典"""
+    if isinstance(value, dict):
+        return {key: _copy_results(item) for key, item in value.items()}
+    return value
+
+
+def run_complete_system_batch(t_wb_ambient_C, t_db_ambient_C=None, params=None, workers=1):
+    """
+    Run the integrated system over an array of ambient conditions (e.g. hourly weather).
+    按环境工况数组批量运行完整系统（例如全年逐时气象）
+
+    The chilled-water cascade (Building HX → Compute HX) does not depend on the
+    ambient, so it is solved once; the cooling system is solved for all ambient
+    points with CoolingSystem.solve_sweep (one solve_batch call per worker
+    process) and PUE/WUE are computed with NumPy array expressions. Nothing is
+    printed.
+
+    Args:
+        t_wb_ambient_C: Wet bulb temperature(s) [°C], scalar or array
+        t_db_ambient_C: Dry bulb temperature(s) [°C], scalar/array or None
+        params: SystemParameters (default: SystemParameters())
+        workers: Worker processes for the cooling system solve (default 1,
+            i.e. serial; None uses all CPU cores)
+
+    Returns:
+        dict of arrays, one element per ambient point
+    """
+    if params is None:
+        params = SystemParameters()
+
+    design = _design_point(params)
+    cooling = design.cooling_system.solve_sweep(
+        q_cooling_load_W=design.Q_total_cooling_W,
+        m_dot_chw_kg_s=design.m_dot_chw_kg_s,
+        t_chw_return_C=design.T_water_after_compute_C,
+        t_wb_ambient_C=t_wb_ambient_C,
+        t_db_ambient_C=t_db_ambient_C,
+        workers=workers,
+    )
+
+    # Same KPI definitions as run_complete_system, on arrays
+    (total_IT_power_MW, total_cooling_power_MW, pue,
+     annual_water_m3, annual_it_kwh, wue) = _kpis(
+        params, cooling.total_power_W, design.chip_result['W_pump_W'], cooling.m_makeup_kg_s,
+    )
 
     return {
-        "cooling_system": cooling_result,
-        "chip_cooling": chip_result,
+        "cooling_system": cooling,
+        "chip_cooling": design.chip_result,
         "building_cooling": {
-            "Q_absorbed_W": Q_building_actual_W,
-            "T_water_out_C": T_water_after_building_C,
+            "Q_absorbed_W": design.Q_building_actual_W,
+            "T_water_out_C": design.T_water_after_building_C,
         },
         "water_cascade": {
             "T_chiller_out_C": params.T_CHW_SUPPLY_C,
-            "T_after_building_C": T_water_after_building_C,
-            "T_after_compute_C": T_water_after_compute_C,
+            "T_after_building_C": design.T_water_after_building_C,
+            "T_after_compute_C": design.T_water_after_compute_C,
         },
         "pue": pue,
         "wue": wue,
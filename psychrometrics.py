@@ -12,6 +12,14 @@ All properties use:
 """
 
 import math
+from functools import lru_cache
+
+import numpy as np
+
+# Saturation-pressure coefficients (ASHRAE), ln(P_ws) =
+#   C1/T + C2 + C3*T + C4*T^2 + C5*T^3 + C6*ln(T), T in K
+PSAT_COEFFS_WATER = (-5.8002206e3, 1.3914993, -4.8640239e-2, 4.1764768e-5, -1.4452093e-8, 6.5459673)
+PSAT_COEFFS_ICE = (-5.6745359e3, 6.3925247, -9.6778430e-3, 6.2215701e-7, 2.0747825e-9, -9.4840240e-13)
 
 
 class MoistAir:
@@ -54,26 +62,51 @@ class MoistAir:
         # Antoine equation coefficients for water (ASHRAE)
         if T_C >= 0:
             # Above freezing
-            C1 = -5.8002206e3
-            C2 = 1.3914993
-            C3 = -4.8640239e-2
-            C4 = 4.1764768e-5
-            C5 = -1.4452093e-8
-            C6 = 6.5459673
+            C1, C2, C3, C4, C5, C6 = PSAT_COEFFS_WATER
         else:
             # Below freezing (ice)
-            C1 = -5.6745359e3
-            C2 = 6.3925247
-            C3 = -9.6778430e-3
-            C4 = 6.2215701e-7
-            C5 = 2.0747825e-9
-            C6 = -9.4840240e-13
-
-        ln_Pws = C1 / T_K + C2 + C3 * T_K + C4 * T_K**2 + C5 * T_K**3 + C6 * math.log(T_K)
+            C1, C2, C3, C4, C5, C6 = PSAT_COEFFS_ICE
+
+        # Polynomial part in Horner form: three multiply-adds, no powers
+        ln_Pws = C1 / T_K + ((C5 * T_K + C4) * T_K + C3) * T_K + C2 + C6 * math.log(T_K)
         P_sat = math.exp(ln_Pws)
 
         return P_sat
 
+    @staticmethod
+    def saturation_pressure_array(T_C):
+        """
+        Calculate saturation pressure over a whole array of temperatures.
+
+        Same coefficients as saturation_pressure, with the water/ice set picked
+        per element; the polynomial is evaluated in Horner form. Temperatures
+        outside -20°C to 50°C give NaN instead of raising. float32 input stays
+        float32.
+
+        Args:
+            T_C: Temperature(s) (°C), scalar or array
+
+        Returns:
+            P_sat: Saturation pressure(s) (Pa), ndarray
+        """
+        T_C = np.asarray(T_C)
+        if not np.issubdtype(T_C.dtype, np.floating):
+            T_C = T_C.astype(np.float64)
+
+        T_K = T_C + 273.15
+        above = T_C >= 0
+        # Coefficients are cast to the input dtype so float32 sweeps stay float32
+        C1, C2, C3, C4, C5, C6 = (
+            np.where(above, water, ice).astype(T_C.dtype, copy=False)
+            for water, ice in zip(PSAT_COEFFS_WATER, PSAT_COEFFS_ICE)
+        )
+
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            ln_Pws = C1 / T_K + ((C5 * T_K + C4) * T_K + C3) * T_K + C2 + C6 * np.log(T_K)
+            P_sat = np.exp(ln_Pws)
+
+        return np.where((T_C < -20) | (T_C > 50), np.nan, P_sat)
+
     @staticmethod
     def humidity_ratio_from_RH(T_C, RH, P=P_ATM):
         """
@@ -93,19 +126,7 @@ class MoistAir:
         Raises:
             ValueError: If inputs are invalid
         """
-        if not 0.0 <= RH <= 1.0:
-            raise ValueError(f"RH must be between 0 and 1, got {RH}")
-        if P <= 0:
-            raise ValueError(f"Pressure must be positive, got {P}")
-
-        P_sat = MoistAir.saturation_pressure(T_C)
-        P_v = RH * P_sat
-
-        if P_v >= P:
-            raise ValueError(f"Vapor pressure {P_v} Pa exceeds total pressure {P} Pa")
-
-        w = 0.622 * P_v / (P - P_v)
-        return w
+        return _psy_from_T_RH(T_C, RH, P)[1]
 
     @staticmethod
     def humidity_ratio_from_Twb(T_db_C, T_wb_C, P=P_ATM):
@@ -146,6 +167,104 @@ class MoistAir:
 
         return w
 
+    @staticmethod
+    def humidity_ratio_from_RH_array(T_C, RH, P=P_ATM):
+        """
+        Calculate humidity ratio from temperature and relative humidity arrays.
+
+        Same relation as humidity_ratio_from_RH, evaluated element-wise (inputs
+        broadcast). Elements with RH outside 0-1, vapor pressure >= P or
+        temperature out of range give NaN instead of raising.
+
+        Args:
+            T_C: Dry bulb temperature(s) (°C)
+            RH: Relative humidity (0-1, not percentage)
+            P: Atmospheric pressure (Pa)
+
+        Returns:
+            w: Humidity ratio(s) (kg_water/kg_dry_air), ndarray
+        """
+        P_sat = MoistAir.saturation_pressure_array(T_C)
+        # A scalar RH is applied as given, so float32 temperatures stay float32
+        P_v = RH * P_sat
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            w = 0.622 * P_v / (P - P_v)
+
+        RH = np.asarray(RH)
+        return np.where((RH < 0) | (RH > 1) | (P_v >= P), np.nan, w)
+
+    @staticmethod
+    def humidity_ratio_from_Twb_array(T_db_C, T_wb_C, P=P_ATM):
+        """
+        Calculate humidity ratio from dry bulb and wet bulb temperature arrays.
+
+        Same psychrometric equation as humidity_ratio_from_Twb, evaluated
+        element-wise (inputs broadcast), with one saturation-pressure call for
+        the whole wet bulb array. Elements with T_wb > T_db or temperatures out
+        of range give NaN instead of raising.
+
+        Args:
+            T_db_C: Dry bulb temperature(s) (°C)
+            T_wb_C: Wet bulb temperature(s) (°C)
+            P: Atmospheric pressure (Pa)
+
+        Returns:
+            w: Humidity ratio(s) (kg_water/kg_dry_air), ndarray
+        """
+        T_db_C = np.asarray(T_db_C)
+        T_wb_C = np.asarray(T_wb_C)
+
+        P_sat_wb = MoistAir.saturation_pressure_array(T_wb_C)
+        w_sat_wb = 0.622 * P_sat_wb / (P - P_sat_wb)
+
+        h_fg = MoistAir.H_FG_0 - 2400 * T_wb_C
+
+        numerator = w_sat_wb * h_fg - MoistAir.CP_DA * (T_db_C - T_wb_C)
+        denominator = h_fg + MoistAir.CP_WV * T_db_C
+
+        w = np.clip(numerator / denominator, 0.0, w_sat_wb)
+
+        return np.where(T_wb_C > T_db_C, np.nan, w)
+
+    @staticmethod
+    def air_state_arrays(T_db_C, T_wb_C=None, RH=None, P=P_ATM):
+        """
+        Humidity ratio, enthalpy and relative humidity on whole arrays.
+
+        From dry bulb plus either wet bulb or RH, with the same formulas as
+        PsychrometricState. Unlike the other *_array methods, invalid inputs
+        raise ValueError (as the scalar path does) instead of giving NaN.
+
+        Args:
+            T_db_C: Dry bulb temperature(s) (°C), ndarray
+            T_wb_C: Wet bulb temperature(s) (°C), or None
+            RH: Relative humidity (0-1), used when T_wb_C is None
+            P: Atmospheric pressure (Pa)
+
+        Returns:
+            (w, h, RH) arrays
+
+        Raises:
+            ValueError: If a temperature is out of range or T_wb > T_db
+        """
+        if T_wb_C is not None:
+            if np.any(T_wb_C > T_db_C):
+                raise ValueError("Wet bulb temp cannot exceed dry bulb")
+            # T_db is range-checked below, and T_wb <= T_db covers the upper bound
+            if np.any(T_wb_C < -20):
+                raise ValueError(f"Temperature {T_wb_C[T_wb_C < -20]}°C out of valid range [-20, 50]°C")
+
+        P_sat = _saturation_pressure_array_checked(T_db_C)
+        if T_wb_C is not None:
+            w = MoistAir.humidity_ratio_from_Twb_array(T_db_C, T_wb_C, P)
+        else:
+            w = MoistAir.humidity_ratio_from_RH_array(T_db_C, RH, P)
+
+        h = MoistAir.enthalpy(T_db_C, w)
+        rh = np.minimum(1.0, np.maximum(0.0, (w * P / (0.622 + w)) / P_sat))
+        return w, h, rh
+
     @staticmethod
     def enthalpy(T_C, w):
         """
@@ -154,8 +273,8 @@ class MoistAir:
         h = cp_da * T + w * (h_fg0 + cp_wv * T)
 
         Args:
-            T_C: Dry bulb temperature (°C)
-            w: Humidity ratio (kg_water/kg_dry_air)
+            T_C: Dry bulb temperature(s) (°C), scalar or array
+            w: Humidity ratio(s) (kg_water/kg_dry_air), scalar or array
 
         Returns:
             h: Specific enthalpy (J/kg_dry_air)
@@ -163,7 +282,7 @@ class MoistAir:
         Raises:
             ValueError: If w is negative
         """
-        if w < 0:
+        if np.any(np.less(w, 0)):
             raise ValueError(f"Humidity ratio must be non-negative, got {w}")
 
         h = MoistAir.CP_DA * T_C + w * (MoistAir.H_FG_0 + MoistAir.CP_WV * T_C)
@@ -225,13 +344,58 @@ class MoistAir:
         return min(1.0, max(0.0, RH))
 
 
+def _psy_from_T_RH(T_C, RH, P):
+    """
+    Saturation pressure and humidity ratio from dry bulb and RH in one pass,
+    so callers that also need P_sat (e.g. for RH) do not recompute it.
+
+    Returns:
+        (P_sat, w)
+    """
+    if not 0.0 <= RH <= 1.0:
+        raise ValueError(f"RH must be between 0 and 1, got {RH}")
+    if P <= 0:
+        raise ValueError(f"Pressure must be positive, got {P}")
+
+    P_sat = MoistAir.saturation_pressure(T_C)
+    P_v = RH * P_sat
+
+    if P_v >= P:
+        raise ValueError(f"Vapor pressure {P_v} Pa exceeds total pressure {P} Pa")
+
+    w = 0.622 * P_v / (P - P_v)
+    return P_sat, w
+
+
+def _saturation_pressure_array_checked(T_C):
+    """
+    MoistAir.saturation_pressure_array, but raising on out-of-range temperatures
+    like the scalar path instead of returning NaN.
+    """
+    if np.any((T_C < -20) | (T_C > 50)):
+        raise ValueError(f"Temperature {T_C[(T_C < -20) | (T_C > 50)]}°C out of valid range [-20, 50]°C")
+    return MoistAir.saturation_pressure_array(T_C)
+
+
+def _w_from_h(T_db_C, h):
+    """Solve for w from h = cp_da * T + w * (h_fg0 + cp_wv * T)."""
+    numerator = h - MoistAir.CP_DA * T_db_C
+    denominator = MoistAir.H_FG_0 + MoistAir.CP_WV * T_db_C
+    return numerator / denominator
+
+
 class PsychrometricState:
     """
     Represents a complete thermodynamic state of moist air.
 
     Given two independent properties, all other properties are calculated.
+    The from_Tdb_* constructors skip the generic argument dispatch when the
+    input pair is known. States are immutable once built, so one instance can
+    be shared between callers (see cached()).
     """
 
+    __slots__ = ("P", "T_db", "w", "h", "RH", "v", "rho", "T_wb")
+
     def __init__(self, T_db_C=None, T_wb_C=None, w=None, RH=None, h=None, P=MoistAir.P_ATM):
         """
         Initialize psychrometric state from two independent properties.
@@ -253,8 +417,6 @@ class PsychrometricState:
         Raises:
             ValueError: If invalid combination of properties provided
         """
-        self.P = P
-
         # Count how many properties are specified
         specified = sum([x is not None for x in [T_db_C, T_wb_C, w, RH, h]])
 
@@ -264,31 +426,101 @@ class PsychrometricState:
         if specified < 2:
             raise ValueError("At least two properties must be specified")
 
-        self.T_db = T_db_C
-
         # Calculate humidity ratio from available properties
+        P_sat = None
         if w is not None:
-            self.w = w
+            pass
         elif RH is not None:
-            self.w = MoistAir.humidity_ratio_from_RH(T_db_C, RH, P)
+            P_sat, w = _psy_from_T_RH(T_db_C, RH, P)
         elif T_wb_C is not None:
-            self.w = MoistAir.humidity_ratio_from_Twb(T_db_C, T_wb_C, P)
+            w = MoistAir.humidity_ratio_from_Twb(T_db_C, T_wb_C, P)
         elif h is not None:
-            # Solve for w from h = cp_da * T + w * (h_fg0 + cp_wv * T)
-            numerator = h - MoistAir.CP_DA * T_db_C
-            denominator = MoistAir.H_FG_0 + MoistAir.CP_WV * T_db_C
-            self.w = numerator / denominator
+            w = _w_from_h(T_db_C, h)
         else:
             raise ValueError("Need one of: w, RH, T_wb, or h in addition to T_db")
 
-        # Calculate all other properties
-        self.h = MoistAir.enthalpy(self.T_db, self.w)
-        self.RH = MoistAir.relative_humidity(self.T_db, self.w, P)
-        self.v = MoistAir.specific_volume(self.T_db, self.w, P)
-        self.rho = MoistAir.density(self.T_db, self.w, P)
+        self._set_properties(T_db_C, w, P, P_sat, T_wb_C)
+
+    def _set_properties(self, T_db_C, w, P, P_sat=None, T_wb_C=None):
+        """Fill in all properties from dry bulb and humidity ratio."""
+        set_ = object.__setattr__  # bypasses the read-only __setattr__
+        set_(self, "P", P)
+        set_(self, "T_db", T_db_C)
+        set_(self, "w", w)
+
+        # Calculate all other properties in one pass: the saturation pressure at
+        # T_db and the specific volume are each evaluated once
+        set_(self, "h", MoistAir.enthalpy(T_db_C, w))
+        if P_sat is None:
+            P_sat = MoistAir.saturation_pressure(T_db_C)
+        P_v = w * P / (0.622 + w)
+        set_(self, "RH", min(1.0, max(0.0, P_v / P_sat)))
+        v = MoistAir.specific_volume(T_db_C, w, P)
+        set_(self, "v", v)
+        set_(self, "rho", 1.0 / v)
 
         # Store wet bulb if provided, otherwise leave as None
-        self.T_wb = T_wb_C
+        set_(self, "T_wb", T_wb_C)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"PsychrometricState is immutable; cannot set {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"PsychrometricState is immutable; cannot delete {name!r}")
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_Tdb_Twb(cls, T_db_C, T_wb_C, P=MoistAir.P_ATM):
+        """State from dry bulb and wet bulb temperatures (°C)."""
+        state = cls.__new__(cls)
+        state._set_properties(T_db_C, MoistAir.humidity_ratio_from_Twb(T_db_C, T_wb_C, P), P, None, T_wb_C)
+        return state
+
+    @classmethod
+    def from_Tdb_RH(cls, T_db_C, RH, P=MoistAir.P_ATM):
+        """State from dry bulb temperature (°C) and relative humidity (0-1)."""
+        state = cls.__new__(cls)
+        P_sat, w = _psy_from_T_RH(T_db_C, RH, P)
+        state._set_properties(T_db_C, w, P, P_sat)
+        return state
+
+    @classmethod
+    def from_Tdb_w(cls, T_db_C, w, P=MoistAir.P_ATM):
+        """State from dry bulb temperature (°C) and humidity ratio (kg/kg)."""
+        state = cls.__new__(cls)
+        state._set_properties(T_db_C, w, P)
+        return state
+
+    @classmethod
+    def from_Tdb_h(cls, T_db_C, h, P=MoistAir.P_ATM):
+        """State from dry bulb temperature (°C) and enthalpy (J/kg_dry_air)."""
+        state = cls.__new__(cls)
+        state._set_properties(T_db_C, _w_from_h(T_db_C, h), P)
+        return state
+
+    @classmethod
+    def cached(cls, T_db_C=None, T_wb_C=None, w=None, RH=None, h=None, P=MoistAir.P_ATM):
+        """
+        Shared state for a given set of inputs, built once and then reused.
+
+        For callers that revisit the same ambient conditions many times (e.g.
+        hourly weather in sweeps; CoolingTower.air_states uses it). Inputs are
+        matched exactly, not rounded, so a cached state is identical to a
+        freshly built one. States are immutable, so sharing one is safe.
+
+        Args:
+            Same as PsychrometricState()
+
+        Returns:
+            PsychrometricState
+        """
+        return _cached_state(T_db_C, T_wb_C, w, RH, h, P)
 
     def __repr__(self):
         """String representation of psychrometric state."""
@@ -299,6 +531,11 @@ class PsychrometricState:
         )
 
 
+@lru_cache(maxsize=4096)
+def _cached_state(T_db_C, T_wb_C, w, RH, h, P):
+    return PsychrometricState(T_db_C=T_db_C, T_wb_C=T_wb_C, w=w, RH=RH, h=h, P=P)
+
+
 def test_psychrometrics():
     """
     Test psychrometric calculations with known values.